@@ -0,0 +1,84 @@
+"""Огненные шары: обычная группа с новыми спрайтами против FireballPool.
+
+Держит на экране --live шаров: каждый кадр все падают, улетевшие вниз
+сразу появляются заново наверху. Печатает время update() на кадр, сколько
+экземпляров Fireball создано и сколько памяти выделено за кадры.
+
+    python benchmarks/bench_fireballs.py --live 5000 --frames 300
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from platformer.settings import WIDTH, HEIGHT  # noqa: E402
+from platformer.sprites import Fireball, FireballPool  # noqa: E402
+
+created = 0
+_fireball_init = Fireball.__init__
+
+
+def _counting_init(self, x):
+    global created
+    created += 1
+    _fireball_init(self, x)
+
+
+Fireball.__init__ = _counting_init
+
+
+def run_group(live, frames, rng):
+    global created
+    group = pygame.sprite.Group()
+    for _ in range(live):
+        fireball = Fireball(rng.randint(0, WIDTH - 30))
+        fireball.rect.y = rng.randint(-15, HEIGHT)
+        group.add(fireball)
+    created = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        group.update()
+        for _ in range(live - len(group)):
+            group.add(Fireball(rng.randint(0, WIDTH - 30)))
+    return time.perf_counter() - start
+
+
+def run_pool(live, frames, rng):
+    global created
+    pool = FireballPool(capacity=live)
+    for _ in range(live):
+        pool.spawn(rng.randint(0, WIDTH - 30)).rect.y = rng.randint(-15, HEIGHT)
+    created = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        pool.update()
+        for _ in range(live - len(pool)):
+            pool.spawn(rng.randint(0, WIDTH - 30))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--live", type=int, default=5000, help="шаров на экране одновременно")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    for name, run in (("group", run_group), ("pool", run_pool)):
+        elapsed = run(args.live, args.frames, random.Random(0))
+        # Память меряем отдельным прогоном: tracemalloc сильно замедляет код
+        tracemalloc.start()
+        run(args.live, args.frames, random.Random(0))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:6} {elapsed / args.frames * 1000:8.3f} мс/кадр  "
+              f"создано Fireball: {created:7}  пик памяти: {peak / 1024:8.0f} КиБ")
+
+
+if __name__ == "__main__":
+    main()
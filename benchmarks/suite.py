@@ -0,0 +1,211 @@
+"""Набор замеров: генерация, достижимость, физика, столкновения и отрисовка.
+
+Каждый замер - лучшее из --repeat время одной операции в микросекундах.
+Результаты пишутся в JSON, и их можно сравнить с прошлой ревизией:
+
+    python benchmarks/suite.py --save before.json
+    python benchmarks/suite.py --compare before.json --threshold 0.15
+
+С --compare команда завершается с кодом 1, если какой-то замер стал
+медленнее больше чем на threshold (доля). Окно не нужно: отрисовка
+меряется с SDL-драйвером dummy, flip там почти ничего не стоит, так что
+замер draw показывает именно нашу работу с поверхностями.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Замеры не должны зависеть от кэша картинок в домашнем каталоге
+os.environ["PLATFORMER_ASSET_CACHE"] = ""
+
+import pygame  # noqa: E402
+
+from platformer.settings import WIDTH, HEIGHT, PLAYER_START  # noqa: E402
+
+# Окно открываем до создания спрайтов: картинки конвертируются, как в игре
+pygame.init()
+SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
+
+from platformer.generation import generate_random_level, coin_is_reachable  # noqa: E402
+from platformer.render import Renderer, RENDER_FULL, RENDER_DIRTY  # noqa: E402
+from platformer.spatial import SpriteGrid  # noqa: E402
+from platformer.sprites import Player, Platform, Coin  # noqa: E402
+from platformer.world import World  # noqa: E402
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def measure(fn, number, repeat):
+    """Лучшее из repeat время одного вызова fn() в мкс (fn вызывается number раз подряд)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def bench_generation(repeat):
+    results = {}
+    for level_num in (0, 3, 6, 9):
+        # Новый rng с тем же зерном на каждый вызов: все повторы меряют один и тот же уровень
+        results[f"generate_random_level[{level_num}]"] = measure(
+            lambda: generate_random_level(level_num, random.Random(level_num)), 20, repeat)
+    return results
+
+
+def bench_reachability(repeat):
+    rng = random.Random(1)
+    platform = Platform(300, 400, 120, 20)
+    coins = [Coin(rng.randint(100, 700), rng.randint(250, 390)) for _ in range(1000)]
+
+    def run():
+        for coin in coins:
+            coin_is_reachable(platform, coin)
+    return {"coin_is_reachable[1000]": measure(run, 5, repeat)}
+
+
+def bench_player_update(repeat):
+    results = {}
+    for count in (10, 100, 1000):
+        rng = random.Random(count)
+        platforms = [Platform(0, HEIGHT - 40, WIDTH, 40)]
+        platforms += [Platform(rng.randint(0, WIDTH - 100), rng.randint(60, HEIGHT - 80), 100, 20)
+                      for _ in range(count - 1)]
+        index = SpriteGrid(platforms)
+        player = Player(*PLAYER_START)
+        state = {"now": 0, "direction": 1}
+
+        def run():
+            state["now"] += 16
+            if player.rect.right >= WIDTH or player.rect.left <= 0:
+                state["direction"] = -state["direction"]
+            if player.on_ground and state["now"] % 512 == 0:
+                player.jump()
+            player.update(state["direction"], state["now"], index)
+        results[f"Player.update[{count} платформ]"] = measure(run, 2000, repeat)
+    return results
+
+
+def bench_collisions(repeat):
+    results = {}
+    for count in (50, 250):
+        rng = random.Random(count)
+        level = {"platforms": [Platform(0, HEIGHT - 40, WIDTH, 40)],
+                 "coins": [Coin(rng.randint(10, WIDTH - 10), rng.randint(10, HEIGHT - 60))
+                           for _ in range(count)],
+                 "fireball_interval": 10 ** 9}
+        world = World(levels=[level], seed=count)
+        for _ in range(count):
+            world.fireball_group.spawn(rng.randint(0, WIDTH - 30)).rect.y = rng.randint(0, HEIGHT - 30)
+        coins = list(world.coin_group)
+        spots = [(rng.randint(0, WIDTH - 60), rng.randint(0, HEIGHT - 60)) for _ in range(256)]
+        state = {"i": 0}
+
+        def run():
+            state["i"] = (state["i"] + 1) % len(spots)
+            world.player.rect.topleft = spots[state["i"]]
+            world.events = []
+            world._collect_coins()
+            world._check_fireballs()
+            # Возвращаем собранные монетки и жизни: каждый вызов в одинаковых условиях
+            if len(world.coin_group) != len(coins):
+                world.coin_group.add(coins)
+            world.lives = 3
+        results[f"collisions[{count} монеток + {count} шаров]"] = measure(run, 500, repeat)
+    return results
+
+
+def bench_draw(repeat):
+    results = {}
+    font = pygame.font.SysFont("Arial", 24)
+    for mode in (RENDER_FULL, RENDER_DIRTY):
+        world = World(seed=7)
+        for x in range(0, WIDTH - 30, 40):
+            world.fireball_group.spawn(x).rect.y = (x * 7) % HEIGHT
+        renderer = Renderer(SCREEN, font, mode=mode)
+        renderer.draw(world)
+        direction = [1]
+
+        # Шаг мира входит в замер (несколько десятков мкс): без него спрайты
+        # стоят на месте, и режим dirty почти ничего не перерисовывает
+        def run():
+            renderer.remember(world)
+            if world.player.rect.right >= WIDTH or world.player.rect.left <= 0:
+                direction[0] = -direction[0]
+            world.step(direction[0])
+            renderer.draw(world, alpha=0.5)
+        results[f"draw+flip[{mode}]"] = measure(run, 200, repeat)
+    return results
+
+
+BENCHMARKS = {
+    "generation": bench_generation,
+    "reachability": bench_reachability,
+    "player": bench_player_update,
+    "collisions": bench_collisions,
+    "draw": bench_draw,
+}
+
+
+def compare(results, baseline, threshold):
+    """Печатает сравнение с базой; возвращает имена замеров, ставших медленнее порога."""
+    regressions = []
+    for name, us in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"  {name:40} {us:10.1f} мкс   (нет в базе)")
+            continue
+        change = us / old - 1
+        mark = ""
+        if change > threshold:
+            mark = "  <-- регрессия"
+            regressions.append(name)
+        print(f"  {name:40} {us:10.1f} мкс   было {old:10.1f}  {change:+7.1%}{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="запустить только эти группы")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="FILE", help="записать результаты в JSON")
+    parser.add_argument("--compare", metavar="FILE", help="сравнить с результатами из JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое замедление, доля (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for group in args.only or BENCHMARKS:
+        results.update(BENCHMARKS[group](args.repeat))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+    else:
+        for name, us in results.items():
+            print(f"  {name:40} {us:10.1f} мкс")
+
+    if args.save:
+        meta = {"python": platform.python_version(), "pygame": pygame.version.ver,
+                "machine": platform.machine(), "time": time.strftime("%Y-%m-%d %H:%M:%S")}
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+    if regressions:
+        print(f"Медленнее порога {args.threshold:.0%}: {len(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+"""Платформер: Все монетки доступны!
+
+Модули пакета ничего тяжёлого не делают при импорте - окно, звук,
+картинки и уровни появляются только когда они нужны:
+
+    settings    константы экрана, физики и игры
+    assets      загрузка картинок и звуков (пул потоков, дисковый кэш)
+    sprites     игрок, платформы, монетки, огненные шары и их физика
+    generation  генерация уровней и проверка достижимости
+    world       мир одной партии без окна: шаги, столкновения, уровни
+    render      отрисовка мира
+    game        окно и игровой цикл (python -m platformer)
+
+Инструменты: packgen (наборы уровней), replay (повтор записанного ввода),
+profiler (замер фаз кадра), batch (пакетная физика на NumPy).
+Игра по сети: net (протокол), server (python -m platformer.server),
+client (python -m platformer.client).
+"""
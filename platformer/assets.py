@@ -0,0 +1,202 @@
+"""Загрузка ресурсов: картинки и звуки декодируются параллельно в пуле потоков.
+
+Готовые (уже масштабированные) картинки кэшируются по пути ресурса и
+целевому размеру, так что повторная загрузка того же файла бесплатна.
+Кроме того, масштабированные пиксели сохраняются на диск (ASSET_CACHE_DIR)
+с ключом "хэш исходного файла + размер": следующий запуск читает их как
+сырой буфер через image.frombuffer, без декодирования PNG и scale.
+Изменился исходник - изменился хэш, и кэш просто не находится.
+Время загрузки каждого ресурса записывается в assets.timings и печатается
+report() - по нему видно, из чего складывается холодный старт (в том числе
+у сборки PyInstaller, для которой нужен resource_path).
+"""
+import hashlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from .settings import WIDTH, HEIGHT
+
+# Всё, что игра загружает: имя -> (путь, размер)
+IMAGES = {
+    "background": ("images/background.png", (WIDTH, HEIGHT)),
+    "player": ("images/cat_basic.png", (60, 60)),
+    "player_burned": ("images/cat_burned_f3.png", (60, 60)),
+    "coin": ("images/coin.png", (20, 20)),
+    "fireball": ("images/fireball.png", (30, 30)),
+}
+SOUNDS = {
+    "jump": "sounds/jump.wav",
+    "coin": "sounds/coin.wav",
+    "hurt": "sounds/hurt.wav",
+    "game_over": "sounds/game_over.wav",
+}
+
+
+def resource_path(relative_path):
+    """ Возвращает абсолютный путь к ресурсу, работает для .exe и скрипта. """
+    try:
+        # Если программа запущена из .exe
+        base_path = sys._MEIPASS
+    except AttributeError:
+        # Если программа запущена из исходного кода: images/ и sounds/ лежат рядом с пакетом
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    return os.path.join(base_path, relative_path)
+
+
+# Кэш масштабированных картинок на диске; PLATFORMER_ASSET_CACHE="" отключает его
+ASSET_CACHE_DIR = os.environ.get(
+    "PLATFORMER_ASSET_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "2d-platform", "assets"))
+ASSET_CACHE_FORMAT = "v1"
+
+
+def _cache_name(path, digest, size):
+    slug = path.replace("/", "_").replace("\\", "_")
+    return f"{slug}-{ASSET_CACHE_FORMAT}-{size[0]}x{size[1]}-{digest}.rgba"
+
+
+def _read_cached(path, source, size):
+    """Пиксели из дискового кэша или None; ключ - хэш содержимого исходника."""
+    digest = hashlib.sha1(source).hexdigest()
+    cached = os.path.join(ASSET_CACHE_DIR, _cache_name(path, digest, size))
+    # Любая ошибка чтения кэша (нет файла, обрезан, испорчен) - промах: картинка строится заново
+    try:
+        with open(cached, "rb") as f:
+            data = f.read()
+        if len(data) != size[0] * size[1] * 4:
+            return digest, None
+        return digest, pygame.image.frombuffer(data, size, "RGBA")
+    except (OSError, ValueError, pygame.error):
+        return digest, None
+
+
+def _write_cached(path, digest, size, image):
+    name = _cache_name(path, digest, size)
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        target = os.path.join(ASSET_CACHE_DIR, name)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pygame.image.tobytes(image, "RGBA"))
+        os.replace(tmp, target)
+        # Старые версии этой же картинки (исходник поменялся) больше не нужны
+        stale = name.rsplit("-", 1)[0] + "-"
+        for other in os.listdir(ASSET_CACHE_DIR):
+            if other.startswith(stale) and other != name and other.endswith(".rgba"):
+                os.remove(os.path.join(ASSET_CACHE_DIR, other))
+    except OSError as e:
+        print(f"Не удалось записать кэш {path}: {e}")
+
+
+def _decode_image(path, size):
+    try:
+        with open(resource_path(path), "rb") as f:
+            source = f.read()
+        if not ASSET_CACHE_DIR:
+            return pygame.transform.scale(pygame.image.load(io.BytesIO(source), path), size)
+        digest, image = _read_cached(path, source, size)
+        if image is None:
+            image = pygame.transform.scale(pygame.image.load(io.BytesIO(source), path), size)
+            _write_cached(path, digest, size, image)
+        return image
+    except (OSError, pygame.error) as e:
+        # Нет файла или он не читается как картинка - играем с пустой заглушкой
+        print(f"Не удалось загрузить {path}: {e}")
+        return pygame.Surface(size, pygame.SRCALPHA)
+
+
+class AssetManager:
+    """Кэш картинок и звуков с фоновой загрузкой.
+
+    preload() ставит ресурсы в пул потоков и сразу возвращается; пока
+    loaded < total, игра может показывать экран загрузки. image() и sound()
+    отдают готовый ресурс, дожидаясь его или загружая на месте.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.timings = []
+        self._images = {}
+        self._sounds = {}
+        self._pending = {}
+        self._executor = None
+        self._started = None
+
+    def _timed(self, kind, path, load, *args):
+        start = time.perf_counter()
+        result = load(*args)
+        self.timings.append((kind, path, (time.perf_counter() - start) * 1000))
+        return result
+
+    def _submit(self, key, kind, path, load, *args):
+        if key in self._images or key in self._sounds or key in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        if self._started is None:
+            self._started = time.perf_counter()
+        self._pending[key] = self._executor.submit(self._timed, kind, path, load, *args)
+
+    def preload(self, images=IMAGES, sounds=SOUNDS):
+        for path, size in images.values():
+            self._submit(("image", path, tuple(size)), "image", path, _decode_image, path, tuple(size))
+        for path in sounds.values():
+            self._submit(("sound", path), "sound", path, self._load_sound, path)
+
+    @staticmethod
+    def _load_sound(path):
+        return pygame.mixer.Sound(resource_path(path))
+
+    @property
+    def total(self):
+        return len(self._images) + len(self._sounds) + len(self._pending)
+
+    @property
+    def loaded(self):
+        return self.total - sum(not f.done() for f in self._pending.values())
+
+    def _finish(self, key):
+        """Результат фоновой загрузки; ошибку загрузки пробрасывает вызывающему."""
+        return self._pending.pop(key).result()
+
+    def image(self, path, size):
+        key = ("image", path, tuple(size))
+        image = self._images.get(key)
+        if image is None:
+            if key in self._pending:
+                image = self._finish(key)
+            else:
+                image = self._timed("image", path, _decode_image, path, tuple(size))
+            # convert_alpha() - только из основного потока и только при открытом окне
+            if pygame.display.get_surface() is not None:
+                image = self._timed("convert", path, image.convert_alpha)
+            self._images[key] = image
+        return image
+
+    def sound(self, path):
+        key = ("sound", path)
+        sound = self._sounds.get(key)
+        if sound is None:
+            if key in self._pending:
+                sound = self._finish(key)
+            else:
+                sound = self._timed("sound", path, self._load_sound, path)
+            self._sounds[key] = sound
+        return sound
+
+    def report(self):
+        """Печатает время загрузки каждого ресурса, от самых долгих."""
+        for kind, path, ms in sorted(self.timings, key=lambda t: -t[2]):
+            print(f"  {kind:8} {path:32} {ms:8.1f} мс")
+        if self._started is not None:
+            wall = (time.perf_counter() - self._started) * 1000
+            print(f"  ресурсов: {len(self.timings)}, сумма {sum(t[2] for t in self.timings):.1f} мс, "
+                  f"от начала загрузки {wall:.1f} мс ({self.workers} потоков)")
+
+
+assets = AssetManager()
@@ -0,0 +1,71 @@
+"""Звук с бюджетом каналов микшера.
+
+Каждый звук (прыжок, монетка, попадание, конец игры) получает свои
+заранее зарезервированные каналы - AUDIO_CHANNELS. Звук играет только на
+своих каналах: пачка монеток за один кадр не займёт весь микшер и не
+вытеснит остальные звуки. Если все каналы звука заняты, новый запуск
+перебивает самый старый из них. Повтор того же звука раньше чем через
+SOUND_REPEAT_MS после предыдущего не играется совсем.
+
+report() печатает, сколько раз звук сыграл, сколько повторов отброшено,
+сколько раз пришлось перебить канал и сколько каналов было занято сразу.
+"""
+import pygame
+
+from .settings import AUDIO_CHANNELS, SOUND_REPEAT_MS
+
+
+class AudioManager:
+    def __init__(self, sounds, channels=AUDIO_CHANNELS, repeat_ms=SOUND_REPEAT_MS):
+        self.sounds = sounds
+        self.repeat_ms = repeat_ms
+        names = [name for name in sounds if channels.get(name, 0) > 0]
+        total = sum(channels[name] for name in names)
+        # Зарезервированные каналы Sound.play() сам не берёт - они только наши
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self.channels = {}
+        first = 0
+        for name in names:
+            self.channels[name] = [pygame.mixer.Channel(i) for i in range(first, first + channels[name])]
+            first += channels[name]
+        self.stats = {name: {"played": 0, "throttled": 0, "stolen": 0, "peak": 0} for name in names}
+        self._last = {}
+        self._started = {}
+
+    def play(self, name, now):
+        """Играет звук name в момент now (мс); возвращает канал или None."""
+        channels = self.channels.get(name)
+        if channels is None:
+            return None
+        stats = self.stats[name]
+        last = self._last.get(name)
+        if last is not None and now - last < self.repeat_ms:
+            stats["throttled"] += 1
+            return None
+        busy = [channel for channel in channels if channel.get_busy()]
+        free = [channel for channel in channels if channel not in busy]
+        if free:
+            channel = free[0]
+        else:
+            channel = min(channels, key=lambda c: self._started.get(c, 0))
+            stats["stolen"] += 1
+        channel.play(self.sounds[name])
+        self._last[name] = now
+        self._started[channel] = now
+        stats["played"] += 1
+        stats["peak"] = max(stats["peak"], len(busy) + (channel not in busy))
+        return channel
+
+    def busy(self):
+        """Сколько каналов каждого звука играет прямо сейчас."""
+        return {name: sum(c.get_busy() for c in channels) for name, channels in self.channels.items()}
+
+    def report(self):
+        print(f"Звук: каналов в микшере {pygame.mixer.get_num_channels()}, "
+              f"зарезервировано {sum(len(c) for c in self.channels.values())}")
+        for name, stats in self.stats.items():
+            print(f"  {name:10} каналов {len(self.channels[name])}, сыграно {stats['played']:5}, "
+                  f"отброшено повторов {stats['throttled']:5}, перебито {stats['stolen']:5}, "
+                  f"занято сразу до {stats['peak']}")
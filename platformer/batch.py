@@ -0,0 +1,131 @@
+"""Пакетная физика: N независимых копий игры в массивах NumPy.
+
+Каждый шаг применяет те же правила, что и Player.update / Fireball.update
+(гравитация, jump_power, player_speed, приземление на платформу сверху),
+но сразу для всех копий, без цикла Python по спрайтам и платформам.
+Результаты совпадают с покадровой симуляцией спрайтов один в один,
+включая округление координат pygame.Rect.
+"""
+import numpy as np
+
+from .settings import WIDTH, HEIGHT, gravity, jump_power, player_speed
+
+PLAYER_SIZE = (60, 60)
+FIREBALL_SIZE = (30, 30)
+FIREBALL_SPEED = 5
+
+
+def _rect_round(values):
+    """Округление как при присваивании float в pygame.Rect: половины - от нуля."""
+    whole = np.trunc(values)
+    frac = values - whole
+    return (whole + np.sign(values) * (np.abs(frac) >= 0.5)).astype(np.int64)
+
+
+def _platform_arrays(layouts):
+    """Список раскладок платформ -> массивы (N, P) с маской занятых ячеек."""
+    n = len(layouts)
+    count = max((len(layout) for layout in layouts), default=0)
+    rects = np.zeros((n, max(count, 1), 4), dtype=np.int64)
+    valid = np.zeros((n, max(count, 1)), dtype=bool)
+    for i, layout in enumerate(layouts):
+        for j, p in enumerate(layout):
+            rect = getattr(p, "rect", p)
+            rects[i, j] = tuple(rect)
+            valid[i, j] = True
+    return rects, valid
+
+
+class BatchPhysics:
+    """Состояние игроков и огненных шаров для N копий игры.
+
+    layouts - по одной раскладке платформ на копию. Раскладка - это спрайты
+    Platform, pygame.Rect или кортежи (x, y, w, h); порядок важен так же,
+    как порядок обхода platform_group.
+    """
+
+    def __init__(self, layouts, start=(100, 500), max_fireballs=32):
+        n = len(layouts)
+        self.n = n
+        self.width, self.height = PLAYER_SIZE
+        self.x = np.full(n, start[0], dtype=np.int64)
+        self.y = np.full(n, start[1], dtype=np.int64)
+        self.vel_y = np.zeros(n, dtype=np.float64)
+        self.on_ground = np.zeros(n, dtype=bool)
+        self.set_platforms(layouts)
+
+        self.fireball_x = np.zeros((n, max_fireballs), dtype=np.int64)
+        self.fireball_y = np.zeros((n, max_fireballs), dtype=np.int64)
+        self.fireball_alive = np.zeros((n, max_fireballs), dtype=bool)
+
+    @classmethod
+    def shared(cls, n, layout, **kwargs):
+        """N копий на одной и той же раскладке платформ."""
+        return cls([layout] * n, **kwargs)
+
+    @classmethod
+    def from_worlds(cls, worlds, max_fireballs=32):
+        """Собирает пакет из текущего состояния объектов World."""
+        batch = cls([list(w.platform_group) for w in worlds], max_fireballs=max_fireballs)
+        for i, w in enumerate(worlds):
+            p = w.player
+            batch.x[i], batch.y[i] = p.rect.topleft
+            batch.vel_y[i] = p.vel_y
+            batch.on_ground[i] = p.on_ground
+            for fireball in w.fireball_group:
+                batch.spawn_fireball(i, fireball.rect.centerx, fireball.rect.top)
+        return batch
+
+    def set_platforms(self, layouts):
+        rects, self.platform_valid = _platform_arrays(layouts)
+        self.platform_x = rects[:, :, 0]
+        self.platform_y = rects[:, :, 1]
+        self.platform_w = rects[:, :, 2]
+        self.platform_h = rects[:, :, 3]
+
+    def step(self, direction, jump=None):
+        """Один шаг физики всех копий.
+
+        direction - массив -1/0/1 (или одно число для всех), jump - массив bool:
+        прыжок срабатывает только у стоящих на земле, как Player.jump().
+        """
+        if jump is not None:
+            self.vel_y = np.where(np.asarray(jump) & self.on_ground, float(jump_power), self.vel_y)
+        dx = np.asarray(direction, dtype=np.int64) * player_speed
+
+        self.vel_y = self.vel_y + gravity
+        dy = self.vel_y
+        bottom = self.y + self.height
+
+        # future_rect = rect.move(0, dy): pygame отбрасывает дробную часть смещения
+        future_top = (self.y + np.trunc(dy).astype(np.int64))[:, None]
+        left = self.x[:, None]
+        hit = (self.platform_valid
+               & (self.platform_x < left + self.width) & (self.platform_x + self.platform_w > left)
+               & (self.platform_y < future_top + self.height) & (self.platform_y + self.platform_h > future_top))
+        land = hit & (self.vel_y > 0)[:, None] & (bottom[:, None] <= self.platform_y + 10)
+        # После первого приземления vel_y = 0, поэтому срабатывает первая платформа по порядку
+        landed = land.any(axis=1)
+        top = np.take_along_axis(self.platform_y, land.argmax(axis=1)[:, None], axis=1)[:, 0]
+        dy = np.where(landed, top - bottom, dy)
+        self.vel_y = np.where(landed, 0.0, self.vel_y)
+        self.on_ground = landed
+
+        self.x = np.clip(self.x + dx, 0, WIDTH - self.width)
+        self.y = np.minimum(HEIGHT - self.height, _rect_round(self.y + dy))
+
+    def spawn_fireball(self, i, x, top=None):
+        """Кладёт огненный шар в свободный слот копии i (как Fireball(x))."""
+        free = np.flatnonzero(~self.fireball_alive[i])
+        if not free.size:
+            return False
+        slot = free[0]
+        self.fireball_x[i, slot] = x - FIREBALL_SIZE[0] // 2
+        self.fireball_y[i, slot] = -(FIREBALL_SIZE[1] // 2) if top is None else top
+        self.fireball_alive[i, slot] = True
+        return True
+
+    def step_fireballs(self):
+        """Fireball.update для всех шаров: падение и удаление за нижним краем."""
+        self.fireball_y = np.where(self.fireball_alive, self.fireball_y + FIREBALL_SPEED, self.fireball_y)
+        self.fireball_alive &= self.fireball_y <= HEIGHT
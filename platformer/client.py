@@ -0,0 +1,203 @@
+"""Клиент игры по сети: отправляет ввод, собирает состояние из снимков-дельт.
+
+    python -m platformer.client --port 5555            # окно: A/D - ход, SPACE - прыжок
+    python -m platformer.client --bots 50 --seconds 10 # нагрузка без окна
+
+Клиент хранит последние KEEP_STATES состояний по тикам. Снимок приходит
+дельтой к одному из них (база) или полным (база 0); собранное состояние
+подтверждается в следующем вводе, и сервер дальше шлёт дельты к нему.
+"""
+import argparse
+import asyncio
+import random
+import sys
+from collections import OrderedDict
+
+from . import net
+from .replay import INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP
+from .server import DEFAULT_PORT
+from .settings import FPS
+
+KEEP_STATES = 32
+INPUT_INTERVAL = 1 / 30  # с
+
+
+class GameClient:
+    def __init__(self):
+        self.ident = None
+        self.level_index = None
+        self.level = None  # (платформы, монетки, fireball_interval)
+        self.tick = 0
+        self.state = {}
+        self.states = OrderedDict()
+        self.reader = None
+        self.writer = None
+        self.seq = 0
+        self.stats = {"bytes": 0, "full": 0, "delta": 0, "no_base": 0}
+        self._receiving = None
+
+    async def connect(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(net.frame(net.MSG_HELLO))
+        self._receiving = asyncio.create_task(self._receive())
+
+    async def _receive(self):
+        try:
+            while True:
+                kind, body = await net.read_frame(self.reader)
+                self.stats["bytes"] += len(body) + net.FRAME.size + 1
+                if kind == net.MSG_WELCOME:
+                    (self.ident,) = net.WELCOME.unpack(body)
+                elif kind == net.MSG_LEVEL:
+                    self.level_index, self.level = net.decode_level(body)
+                elif kind == net.MSG_SNAPSHOT:
+                    self._apply(*net.decode_snapshot(body))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def _apply(self, tick, base_tick, level, changed, removed):
+        if base_tick == 0:
+            base = {}
+            self.stats["full"] += 1
+        else:
+            base = self.states.get(base_tick)
+            if base is None:
+                # Базу уже выбросили - ждём снимка к тому, что подтверждено
+                self.stats["no_base"] += 1
+                return
+            self.stats["delta"] += 1
+        if tick <= self.tick:
+            return
+        self.state = net.apply_delta(base, changed, removed)
+        self.tick = tick
+        self.states[tick] = self.state
+        while len(self.states) > KEEP_STATES:
+            self.states.popitem(last=False)
+
+    def send_input(self, bits):
+        self.seq += 1
+        self.writer.write(net.frame(net.MSG_INPUT, net.INPUT.pack(self.seq, self.tick, bits)))
+
+    def entities(self, kind):
+        return {ident: values for (k, ident), values in self.state.items() if k == kind}
+
+    async def close(self):
+        self.writer.close()
+        if self._receiving is not None:
+            self._receiving.cancel()
+
+
+async def bot(client, seconds, rng):
+    """Случайный игрок: держит направление по полсекунды-секунде и иногда прыгает."""
+    loop = asyncio.get_running_loop()
+    end = loop.time() + seconds
+    bits = 0
+    change_at = 0.0
+    while loop.time() < end:
+        if loop.time() >= change_at:
+            bits = rng.choice((0, INPUT_LEFT, INPUT_RIGHT))
+            change_at = loop.time() + rng.uniform(0.5, 1.0)
+        client.send_input(bits | (INPUT_JUMP if rng.random() < 0.05 else 0))
+        await asyncio.sleep(INPUT_INTERVAL)
+
+
+async def run_bots(host, port, count, seconds, seed=None):
+    rng = random.Random(seed)
+    clients = [GameClient() for _ in range(count)]
+    for client in clients:
+        await client.connect(host, port)
+    try:
+        await asyncio.gather(*(bot(c, seconds, random.Random(rng.random())) for c in clients))
+    finally:
+        for client in clients:
+            await client.close()
+    report(clients, seconds)
+    return clients
+
+
+def report(clients, seconds):
+    total = sum(c.stats["bytes"] for c in clients)
+    full = sum(c.stats["full"] for c in clients)
+    delta = sum(c.stats["delta"] for c in clients)
+    no_base = sum(c.stats["no_base"] for c in clients)
+    # Сколько весил бы последний снимок, если бы слался целиком
+    sizes = [len(net.encode_snapshot(c.tick, 0, 0, list(c.state.items()), [])) for c in clients]
+    snapshots = max(1, full + delta)
+    print(f"Ботов {len(clients)}: получено {total / 1024:.0f} КиБ, "
+          f"{total / 1024 / max(seconds, 1e-9) / max(1, len(clients)):.1f} КиБ/с на клиента; "
+          f"снимков {full} полных, {delta} дельт, без базы {no_base}")
+    print(f"  средний снимок {total / snapshots:.0f} байт, полный был бы {sum(sizes) / max(1, len(sizes)):.0f} байт")
+
+
+async def view(host, port):
+    import pygame
+    from .sprites import load_images
+    from . import sprites
+    from .settings import WIDTH, HEIGHT, SKY_BLUE, BLACK
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Платформер по сети")
+    font = pygame.font.SysFont("Arial", 24)
+    load_images()
+    client = GameClient()
+    await client.connect(host, port)
+    jump = False
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    jump = True
+            keys = pygame.key.get_pressed()
+            client.send_input(INPUT_LEFT * keys[pygame.K_a] | INPUT_RIGHT * keys[pygame.K_d]
+                              | INPUT_JUMP * jump)
+            jump = False
+
+            screen.fill(SKY_BLUE)
+            if sprites.BACKGROUND_IMG is not None:
+                screen.blit(sprites.BACKGROUND_IMG, (0, 0))
+            if client.level is not None:
+                platforms, coins, _ = client.level
+                for rect in platforms:
+                    pygame.draw.rect(screen, (100, 100, 100), rect)
+                for n in client.entities(net.KIND_COIN):
+                    if n < len(coins):
+                        screen.blit(sprites.COIN_IMG, sprites.COIN_IMG.get_rect(center=coins[n]))
+            for x, y in client.entities(net.KIND_FIREBALL).values():
+                screen.blit(sprites.FIREBALL_IMG, (x, y))
+            for ident, (x, y, score, lives, flags) in client.entities(net.KIND_PLAYER).items():
+                if flags & net.PLAYER_OUT:
+                    continue
+                image = sprites.PLAYER_BURNED_IMG if flags & net.PLAYER_BURNED else sprites.PLAYER_NORMAL_IMG
+                screen.blit(image, (x, y))
+                if ident == client.ident:
+                    screen.blit(font.render(f"Счёт: {score}  Жизни: {lives}", True, BLACK), (10, 10))
+            pygame.display.flip()
+            await asyncio.sleep(1 / FPS)
+    finally:
+        await client.close()
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--bots", type=int, default=0, help="вместо окна подключить столько ботов")
+    parser.add_argument("--seconds", type=float, default=10.0, help="сколько играют боты")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    try:
+        if args.bots:
+            asyncio.run(run_bots(args.host, args.port, args.bots, args.seconds, args.seed))
+        else:
+            asyncio.run(view(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
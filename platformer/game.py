@@ -0,0 +1,235 @@
+"""Игровой цикл: окно, экран загрузки, ввод, звук и шаги мира.
+
+Всё тяжёлое (pygame.init, окно, загрузка ресурсов, генерация уровней)
+происходит только в main(), а не при импорте модуля.
+"""
+import argparse
+import random
+import sys
+
+import pygame
+
+from .assets import assets, SOUNDS
+from .audio import AudioManager
+from .render import (Renderer, ScrollingRenderer, BANNER_LEVEL, BANNER_GAME_OVER, BANNER_VICTORY,
+                     BANNER_DURATION)
+from .settings import (WIDTH, HEIGHT, FPS, BLACK, SKY_BLUE, MAX_FRAME_MS, MAX_STEPS_PER_FRAME,
+                       TOWER_PLATFORMS)
+from .world import (World, EVENT_JUMP, EVENT_COIN, EVENT_HURT,
+                    EVENT_LEVEL, EVENT_GAME_OVER, EVENT_VICTORY)
+
+CAPTION = "Платформер: Все монетки доступны!"
+
+# Какой звук играть на событие шага мира
+EVENT_SOUNDS = {EVENT_JUMP: "jump", EVENT_COIN: "coin", EVENT_HURT: "hurt", EVENT_GAME_OVER: "game_over"}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=CAPTION)
+    parser.add_argument("pack", nargs="?", help="играть готовый набор уровней вместо генерации")
+    parser.add_argument("--render", choices=("full", "dirty"), default="full",
+                        help="full - перерисовывать весь кадр, dirty - только изменившиеся области")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="ограничение частоты кадров (0 - без ограничения); на физику не влияет")
+    parser.add_argument("--profile", action="store_true",
+                        help="замерять фазы кадра; F3 - таблица p50/p95/p99 поверх игры")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="записать время фаз каждого кадра в FILE (.csv или .json); включает --profile")
+    parser.add_argument("--tower", type=int, nargs="?", const=TOWER_PLATFORMS, metavar="N",
+                        help=f"один высокий уровень из N платформ с камерой (по умолчанию {TOWER_PLATFORMS})")
+    parser.add_argument("--seed", type=int, help="зерно уровней и огненных шаров (по умолчанию случайное)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="записать ввод по шагам в FILE для повтора (python -m platformer.replay FILE)")
+    args = parser.parse_args(argv)
+    if args.record and args.seed is not None and not 0 <= args.seed < 2 ** 64:
+        parser.error("--seed для --record - целое от 0 до 2**64 - 1")
+    if args.tower is not None:
+        if args.tower < 1:
+            parser.error("--tower: нужна хотя бы одна платформа")
+        if args.pack or args.record:
+            parser.error("--tower нельзя совмещать с набором уровней и --record")
+        if args.render == "dirty":
+            parser.error("--tower рисует кадр целиком: --render dirty с ним не работает")
+    return args
+
+
+def load_assets(screen, clock, font):
+    """Экран загрузки, пока картинки и звуки декодируются в пуле потоков.
+
+    Возвращает словарь звуков (пустой, если звука нет) или None, если
+    окно закрыли во время загрузки.
+    """
+    sound_enabled = False
+    try:
+        pygame.mixer.init()
+        sound_enabled = True
+    except pygame.error:
+        print("Звуки не загружены")
+    assets.preload(sounds=SOUNDS if sound_enabled else {})
+
+    while assets.loaded < assets.total:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return None
+        screen.fill(SKY_BLUE)
+        screen.blit(font.render(f"Загрузка... {assets.loaded}/{assets.total}", True, BLACK),
+                    (WIDTH // 2 - 80, HEIGHT // 2))
+        pygame.display.flip()
+        clock.tick(FPS)
+
+    sounds = {}
+    if sound_enabled:
+        try:
+            sounds = {name: assets.sound(path) for name, path in SOUNDS.items()}
+        except (pygame.error, FileNotFoundError):
+            print("Звуки не загружены")
+    print("Загрузка ресурсов:")
+    assets.report()
+    return sounds
+
+
+def run(args, screen, clock, font, sounds):
+    seed = args.seed
+    if seed is None and args.record:
+        # Для записи seed нужен явный: без него повтор построит другие уровни
+        seed = random.randrange(2 ** 32)
+    if args.tower is not None:
+        from .tower import TowerWorld
+        world = TowerWorld(args.tower, seed=seed)
+    elif args.pack:
+        from .levelpack import LevelPack
+        world = World(levels=LevelPack(args.pack), seed=seed)
+    else:
+        world = World(seed=seed)
+    recorder = None
+    if args.record:
+        from .replay import Recorder
+        recorder = Recorder(seed, pack=args.pack)
+    if args.tower is not None:
+        # Камера сдвигает весь кадр, поэтому башня всегда рисуется целиком
+        renderer = ScrollingRenderer(screen, font)
+    else:
+        renderer = Renderer(screen, font, mode=args.render)
+    paused = False
+
+    profiler = None
+    if args.profile or args.trace:
+        from .profiler import FrameProfiler
+        profiler = FrameProfiler(keep_trace=bool(args.trace))
+        world.profiler = profiler
+        renderer.profiler = profiler
+
+    # Заставка - состояние цикла, а не пауза: события продолжают обрабатываться,
+    # а пока она на экране, готовится слой нового уровня и в фоне строится следующий
+    banner = None
+    banner_until = 0
+
+    def show_banner(kind):
+        nonlocal banner, banner_until
+        banner = kind
+        banner_until = pygame.time.get_ticks() + BANNER_DURATION[kind]
+
+    show_banner(BANNER_LEVEL)
+    renderer.prepare(world)
+    audio = AudioManager(sounds) if sounds else None
+
+    # Физика идёт фиксированными шагами world.dt_ms, независимо от частоты кадров:
+    # накопленное время расходуется целыми шагами, остаток даёт интерполяцию кадра.
+    running = True
+    accumulator = 0.0
+    jump = False
+    pause_pressed = False
+    clock.tick()
+    while running:
+        frame_ms = clock.tick(args.fps)
+        if profiler is not None:
+            profiler.begin_frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    jump = True
+                elif event.key == pygame.K_ESCAPE:
+                    paused = not paused
+                    pause_pressed = True
+                elif event.key == pygame.K_F3 and profiler is not None:
+                    profiler.overlay = not profiler.overlay
+                    renderer.invalidate()
+        if profiler is not None:
+            profiler.mark("events")
+
+        if banner is not None:
+            if pygame.time.get_ticks() < banner_until:
+                renderer.draw_banner(banner, world)
+                continue
+            if banner != BANNER_LEVEL:
+                break
+            # Время заставки не догоняем, нажатия во время неё не считаем
+            banner = None
+            accumulator = 0.0
+            jump = False
+
+        if not paused:
+            accumulator += min(frame_ms, MAX_FRAME_MS)
+            keys = pygame.key.get_pressed()
+            direction = 1 if keys[pygame.K_d] else -1 if keys[pygame.K_a] else 0
+            steps = 0
+            while banner is None and accumulator >= world.dt_ms and steps < MAX_STEPS_PER_FRAME:
+                accumulator -= world.dt_ms
+                steps += 1
+                renderer.remember(world)
+                if recorder is not None:
+                    recorder.tick(keys[pygame.K_a], keys[pygame.K_d], jump, pause_pressed)
+                    pause_pressed = False
+                events = world.step(direction, jump)
+                jump = False
+                for event in events:
+                    if audio is not None and event in EVENT_SOUNDS:
+                        audio.play(EVENT_SOUNDS[event], world.time_ms)
+                    if event == EVENT_GAME_OVER:
+                        show_banner(BANNER_GAME_OVER)
+                    elif event == EVENT_LEVEL:
+                        show_banner(BANNER_LEVEL)
+                        renderer.prepare(world)
+                    elif event == EVENT_VICTORY:
+                        show_banner(BANNER_VICTORY)
+            # Не успели за отведённые шаги - отстаём, а не копим долг
+            if steps == MAX_STEPS_PER_FRAME:
+                accumulator = min(accumulator, world.dt_ms)
+
+        if banner is None:
+            renderer.draw(world, alpha=accumulator / world.dt_ms)
+            if profiler is not None:
+                profiler.end_frame()
+
+    if recorder is not None:
+        recorder.save(args.record, world)
+        print(f"Ввод записан: {args.record} ({len(recorder.inputs)} шагов, seed {seed})")
+    if profiler is not None:
+        profiler.print_summary()
+        if audio is not None:
+            audio.report()
+        if args.trace:
+            profiler.write_trace(args.trace)
+            print(f"Трасса кадров: {args.trace}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(CAPTION)
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("Arial", 24)
+    try:
+        sounds = load_assets(screen, clock, font)
+        if sounds is not None:
+            run(args, screen, clock, font, sounds)
+    finally:
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
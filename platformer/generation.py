@@ -0,0 +1,97 @@
+"""Генерация уровней: платформы, до которых можно допрыгнуть, и монетки над ними.
+
+Следующая платформа не подбирается попытками "построить и проверить", а
+сразу берётся из области, откуда до неё допрыгивают с предыдущей: центр
+не дальше MAX_HORIZONTAL_DISTANCE, верх выше на MIN_VERTICAL_PLATFORM_GAP
+... MAX_JUMP_HEIGHT. Спрайты строятся только для выбранного места. Цепочка
+идёт только вверх, поэтому экран вмещает не больше max_platforms(HEIGHT - 40)
+платформ; чтобы их поместилось сколько нужно, каждая платформа оставляет
+над собой запас высоты на оставшиеся.
+"""
+import functools
+import random
+
+from . import sprites
+from .settings import (WIDTH, HEIGHT, MAX_JUMP_HEIGHT, MAX_HORIZONTAL_DISTANCE,
+                       MIN_VERTICAL_PLATFORM_GAP)
+from .sprites import Platform, Coin
+
+# Выше этой линии платформ не ставим: над верхней ещё должна поместиться монетка
+MIN_PLATFORM_TOP = 60
+
+
+def can_reach(prev_platform, new_platform):
+    dx = abs(new_platform.rect.centerx - prev_platform.rect.centerx)
+    dy = prev_platform.rect.top - new_platform.rect.top  # сравнение по верхним границам
+    return dx <= MAX_HORIZONTAL_DISTANCE and MIN_VERTICAL_PLATFORM_GAP <= dy <= MAX_JUMP_HEIGHT
+
+
+def coin_is_reachable(platform, coin):
+    start = (platform.rect.centerx, platform.rect.top)
+    vx = (coin.rect.centerx - start[0]) / sprites.COIN_JUMP.sim_steps
+    return sprites.COIN_JUMP.reaches(start, coin.rect.topleft, vx)
+
+
+def max_platforms(top):
+    """Сколько платформ помещается цепочкой над платформой с верхом top."""
+    return max(0, (top - MIN_PLATFORM_TOP) // MIN_VERTICAL_PLATFORM_GAP)
+
+
+@functools.lru_cache(maxsize=None)
+def coin_reachable_at(rise):
+    """coin_is_reachable для монетки, центр которой на rise пикселей выше верха платформы.
+
+    Монетка стоит ровно над центром платформы, прыжок вертикальный, поэтому
+    ответ зависит только от rise - считаем его один раз.
+    """
+    platform = Platform(0, HEIGHT // 2, 100, 20)
+    return coin_is_reachable(platform, Coin(platform.rect.centerx, platform.rect.top - rise))
+
+
+def next_platform(last, remaining, rng):
+    """(x, y, w) платформы, до которой можно допрыгнуть с last (Rect), или None.
+
+    remaining - сколько платформ ещё встанет выше этой: под них
+    оставляется запас высоты, насколько его хватает на экране.
+    """
+    y_hi = last.top - MIN_VERTICAL_PLATFORM_GAP
+    if y_hi < MIN_PLATFORM_TOP:
+        return None
+    reserve = min(remaining, max_platforms(y_hi))
+    y_lo = max(last.top - MAX_JUMP_HEIGHT, MIN_PLATFORM_TOP + reserve * MIN_VERTICAL_PLATFORM_GAP)
+    w = rng.randint(80, 150)
+    y = rng.randint(y_lo, y_hi)
+    # Центр платформы - x + w // 2, как у pygame.Rect.centerx
+    cx = rng.randint(max(w // 2, last.centerx - MAX_HORIZONTAL_DISTANCE),
+                     min(WIDTH - w + w // 2, last.centerx + MAX_HORIZONTAL_DISTANCE))
+    return cx - w // 2, y, w
+
+
+def generate_random_level(level_num, rng=random):
+    """Строит уровень level_num; rng - свой random.Random для воспроизводимости.
+
+    Нужно 3 + level_num * 2 платформ над землёй; в "skipped" - сколько из
+    них не поместилось по высоте экрана (с уровня 3 их больше max_platforms).
+    """
+    platforms = []
+    coins = []
+    start_platform = Platform(0, HEIGHT - 40, WIDTH, 40)
+    platforms.append(start_platform)
+    last = start_platform.rect
+    total_platforms = 3 + level_num * 2
+
+    for placed in range(total_platforms):
+        spot = next_platform(last, total_platforms - placed - 1, rng)
+        if spot is None:
+            break
+        x, y, w = spot
+        coin_y = max(30, y - 30)
+        if not coin_reachable_at(y - coin_y):
+            break
+        platform = Platform(x, y, w, 20)
+        platforms.append(platform)
+        coins.append(Coin(x + w // 2, coin_y))
+        last = platform.rect
+
+    return {"platforms": platforms, "coins": coins, "fireball_interval": max(1000, 5000 - level_num * 400),
+            "skipped": total_platforms - len(coins)}
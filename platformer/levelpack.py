@@ -0,0 +1,116 @@
+"""Компактный двоичный формат наборов уровней.
+
+Набор уровней (level pack) можно сгенерировать и проверить заранее,
+а в игре только прочитать через mmap - без генерации и проверки
+достижимости монеток на старте.
+
+Формат (всё little-endian):
+
+    заголовок   <4sHHI   magic b"LVPK", версия, резерв, число уровней
+    оглавление  <qQIII   на уровень: seed (со знаком), смещение данных, fireball_interval,
+                         число платформ, число монеток
+    данные      <4i      платформа: x, y, w, h
+                <2i      монетка: центр x, центр y
+"""
+import mmap
+import random
+import struct
+
+from .generation import generate_random_level
+from .levels import level_seed
+from .sprites import Platform, Coin
+
+MAGIC = b"LVPK"
+VERSION = 2  # 2: seed уровня со знаком - level_seed отрицателен при отрицательном seed
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<qQIII")
+PLATFORM = struct.Struct("<4i")
+COIN = struct.Struct("<2i")
+
+
+def level_records(level):
+    """Уровень из спрайтов -> (платформы (x, y, w, h), монетки (cx, cy), fireball_interval)."""
+    platforms = [tuple(p.rect) for p in level["platforms"]]
+    coins = [c.rect.center for c in level["coins"]]
+    return platforms, coins, level["fireball_interval"]
+
+
+def build_level(platforms, coins, fireball_interval):
+    """Записи платформ и монеток -> уровень из спрайтов, как у generate_random_level."""
+    return {"platforms": [Platform(*p) for p in platforms],
+            "coins": [Coin(*c) for c in coins],
+            "fireball_interval": fireball_interval}
+
+
+def write_pack(path, levels, seeds=None):
+    """Записывает уровни (спрайты или записи level_records) в файл набора."""
+    entries = []
+    chunks = []
+    offset = HEADER.size + ENTRY.size * len(levels)
+    for i, level in enumerate(levels):
+        platforms, coins, interval = level_records(level) if isinstance(level, dict) else level
+        data = b"".join([PLATFORM.pack(*p) for p in platforms] + [COIN.pack(*c) for c in coins])
+        seed = seeds[i] if seeds is not None else 0
+        entries.append(ENTRY.pack(seed, offset, interval, len(platforms), len(coins)))
+        chunks.append(data)
+        offset += len(data)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(levels)))
+        f.writelines(entries)
+        f.writelines(chunks)
+
+
+def generate_pack(path, num_levels, seed):
+    """Генерирует num_levels уровней с зёрнами level_seed(seed, i) и пишет набор."""
+    seeds = [level_seed(seed, i) for i in range(num_levels)]
+    levels = [generate_random_level(i, random.Random(s)) for i, s in enumerate(seeds)]
+    write_pack(path, levels, seeds)
+
+
+class LevelPack:
+    """Набор уровней из файла, отображённого в память.
+
+    Ведёт себя как список уровней для World: pack[i] собирает спрайты
+    уровня i прямо из отображённых байтов, остальное не читается.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: не набор уровней (magic={magic!r}, версия {version})")
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def entry(self, i):
+        """(seed, смещение, fireball_interval, платформ, монеток) уровня i."""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return ENTRY.unpack_from(self._map, HEADER.size + ENTRY.size * i)
+
+    def seed(self, i):
+        return self.entry(i)[0]
+
+    def records(self, i):
+        _, offset, interval, n_platforms, n_coins = self.entry(i)
+        coins_at = offset + PLATFORM.size * n_platforms
+        platforms = list(PLATFORM.iter_unpack(self._map[offset:coins_at]))
+        coins = list(COIN.iter_unpack(self._map[coins_at:coins_at + COIN.size * n_coins]))
+        return platforms, coins, interval
+
+    def __getitem__(self, i):
+        return build_level(*self.records(i))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,90 @@
+"""Ленивая выдача уровней: генерация по запросу, LRU-кэш и фоновая подготовка."""
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+LEVEL_CACHE_SIZE = 4
+
+
+def level_seed(seed, i):
+    """Зерно уровня i: уровень не зависит от того, в каком порядке их строили."""
+    return seed * 1_000_003 + i
+
+
+class LevelProvider:
+    """Последовательность уровней, которая строит уровень только при обращении.
+
+    generator(i, rng) строит уровень i из своего генератора случайных чисел,
+    поэтому один и тот же seed всегда даёт одни и те же уровни. В памяти
+    держится не больше cache_size уровней (LRU), prefetch(i) строит уровень
+    в фоновом потоке, пока идёт игра.
+    """
+
+    def __init__(self, generator, num_levels, seed=None, cache_size=LEVEL_CACHE_SIZE, background=True):
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.generator = generator
+        self.num_levels = num_levels
+        self.seed = seed
+        self.cache_size = cache_size
+        self.generated = 0
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+
+    def __len__(self):
+        return self.num_levels
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.num_levels:
+            raise IndexError(i)
+        with self._lock:
+            level = self._cache.get(i)
+            if level is not None:
+                self._cache.move_to_end(i)
+                return level
+            future = self._pending.get(i)
+        if future is not None:
+            return future.result()
+        return self._store(i, self._build(i))
+
+    def prefetch(self, i):
+        """Заранее строит уровень i в фоне (если он есть и ещё не готов)."""
+        if self._executor is None or not 0 <= i < self.num_levels:
+            return
+        with self._lock:
+            if i in self._cache or i in self._pending:
+                return
+            self._pending[i] = self._executor.submit(self._prefetch, i)
+
+    def _prefetch(self, i):
+        try:
+            return self._store(i, self._build(i))
+        finally:
+            with self._lock:
+                self._pending.pop(i, None)
+
+    def _build(self, i):
+        level = self.generator(i, random.Random(level_seed(self.seed, i)))
+        with self._lock:
+            self.generated += 1
+        return level
+
+    def _store(self, i, level):
+        with self._lock:
+            level = self._cache.setdefault(i, level)
+            self._cache.move_to_end(i)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return level
+
+    def cached(self):
+        """Номера уровней, которые сейчас в памяти (от давних к свежим)."""
+        with self._lock:
+            return list(self._cache)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,40 @@
+"""Кэш масок столкновений: каждая маска строится один раз и раздаётся всем."""
+import pygame
+
+
+class MaskCache:
+    """Маски по изображению (id поверхности + размер) и сплошные маски по размеру.
+
+    built считает, сколько масок реально построено: после precompute()
+    на старте он не должен расти во время игры.
+    """
+
+    def __init__(self):
+        self.masks = {}
+        self.built = 0
+
+    def get(self, surface):
+        key = (id(surface), surface.get_size())
+        entry = self.masks.get(key)
+        if entry is None:
+            # Храним саму поверхность, чтобы её id не достался новому объекту
+            entry = (surface, pygame.mask.from_surface(surface))
+            self.masks[key] = entry
+            self.built += 1
+        return entry[1]
+
+    def full(self, size):
+        key = ("full", tuple(size))
+        entry = self.masks.get(key)
+        if entry is None:
+            entry = (None, pygame.mask.Mask(size, True))
+            self.masks[key] = entry
+            self.built += 1
+        return entry[1]
+
+    def precompute(self, *surfaces):
+        for surface in surfaces:
+            self.get(surface)
+
+
+mask_cache = MaskCache()
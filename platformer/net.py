@@ -0,0 +1,122 @@
+"""Сетевой протокол игры по сети: кадры, уровень и снимки состояния с дельтами.
+
+Каждое сообщение - <H длина, затем байт типа и тело (little-endian):
+
+    клиент -> сервер
+      HELLO     пусто
+      INPUT     <IIB  номер ввода, последний полученный тик снимка (ack), биты A/D/SPACE
+    сервер -> клиент
+      WELCOME   <H    номер игрока
+      LEVEL     <HIH  номер уровня, fireball_interval, платформ; платформы <4h; <H монеток; монетки <2h
+      SNAPSHOT  <IIHHH  тик, база, уровень, изменённых, удалённых; затем сущности
+
+Состояние - словарь (вид, номер) -> кортеж чисел: игроки (x, y, счёт,
+жизни, флаги), монетки (пустой кортеж - монетка ещё лежит) и огненные
+шары (x, y). Снимок передаёт только то, что изменилось относительно базы -
+последнего снимка, который клиент подтвердил; база 0 - снимок полный.
+"""
+import struct
+
+FRAME = struct.Struct("<H")
+
+MSG_HELLO = 1
+MSG_INPUT = 2
+MSG_WELCOME = 3
+MSG_LEVEL = 4
+MSG_SNAPSHOT = 5
+
+INPUT = struct.Struct("<IIB")
+WELCOME = struct.Struct("<H")
+LEVEL = struct.Struct("<HIH")
+LEVEL_PLATFORM = struct.Struct("<4h")
+LEVEL_COINS = struct.Struct("<H")
+LEVEL_COIN = struct.Struct("<2h")
+SNAPSHOT = struct.Struct("<IIHHH")
+ENTITY = struct.Struct("<BH")
+
+KIND_PLAYER = 0
+KIND_COIN = 1
+KIND_FIREBALL = 2
+# Значения сущности каждого вида
+VALUES = {
+    KIND_PLAYER: struct.Struct("<hhiBB"),  # x, y, счёт, жизни, флаги
+    KIND_COIN: struct.Struct("<"),
+    KIND_FIREBALL: struct.Struct("<hh"),
+}
+
+PLAYER_BURNED = 1
+PLAYER_OUT = 2
+
+
+def frame(kind, body=b""):
+    return FRAME.pack(len(body) + 1) + bytes((kind,)) + body
+
+
+async def read_frame(reader):
+    """(тип, тело) следующего сообщения; IncompleteReadError при закрытом соединении."""
+    (length,) = FRAME.unpack(await reader.readexactly(FRAME.size))
+    data = await reader.readexactly(length)
+    return data[0], data[1:]
+
+
+def encode_level(index, level_records):
+    platforms, coins, interval = level_records
+    parts = [LEVEL.pack(index, interval, len(platforms))]
+    parts += [LEVEL_PLATFORM.pack(*p) for p in platforms]
+    parts.append(LEVEL_COINS.pack(len(coins)))
+    parts += [LEVEL_COIN.pack(*c) for c in coins]
+    return frame(MSG_LEVEL, b"".join(parts))
+
+
+def decode_level(body):
+    """-> (номер уровня, (платформы, монетки, fireball_interval))."""
+    index, interval, n_platforms = LEVEL.unpack_from(body, 0)
+    offset = LEVEL.size
+    platforms = list(LEVEL_PLATFORM.iter_unpack(body[offset:offset + LEVEL_PLATFORM.size * n_platforms]))
+    offset += LEVEL_PLATFORM.size * n_platforms
+    (n_coins,) = LEVEL_COINS.unpack_from(body, offset)
+    offset += LEVEL_COINS.size
+    coins = list(LEVEL_COIN.iter_unpack(body[offset:offset + LEVEL_COIN.size * n_coins]))
+    return index, (platforms, coins, interval)
+
+
+def diff(base, state):
+    """(изменённые и новые сущности, удалённые ключи) между двумя состояниями."""
+    changed = [(key, values) for key, values in state.items() if base.get(key) != values]
+    removed = [key for key in base if key not in state]
+    return changed, removed
+
+
+def encode_snapshot(tick, base_tick, level, changed, removed):
+    parts = [SNAPSHOT.pack(tick, base_tick, level, len(changed), len(removed))]
+    for (kind, ident), values in changed:
+        parts.append(ENTITY.pack(kind, ident))
+        parts.append(VALUES[kind].pack(*values))
+    parts += [ENTITY.pack(kind, ident) for kind, ident in removed]
+    return frame(MSG_SNAPSHOT, b"".join(parts))
+
+
+def decode_snapshot(body):
+    """-> (тик, база, уровень, изменённые, удалённые)."""
+    tick, base_tick, level, n_changed, n_removed = SNAPSHOT.unpack_from(body, 0)
+    offset = SNAPSHOT.size
+    changed = []
+    for _ in range(n_changed):
+        kind, ident = ENTITY.unpack_from(body, offset)
+        offset += ENTITY.size
+        values = VALUES[kind].unpack_from(body, offset)
+        offset += VALUES[kind].size
+        changed.append(((kind, ident), values))
+    removed = []
+    for _ in range(n_removed):
+        removed.append(ENTITY.unpack_from(body, offset))
+        offset += ENTITY.size
+    return tick, base_tick, level, changed, removed
+
+
+def apply_delta(base, changed, removed):
+    state = dict(base)
+    for key in removed:
+        state.pop(key, None)
+    state.update(changed)
+    return state
@@ -0,0 +1,159 @@
+"""Генерация и проверка больших наборов уровней в пуле процессов.
+
+    python -m platformer.packgen levels.lvpk --levels 5000 --seed 42 --workers 8
+    python -m platformer.packgen --check levels.lvpk
+
+Уровень i строится generate_random_level с зерном level_seed(seed, i),
+как в LevelProvider, так что набор воспроизводим и не зависит от числа
+процессов. Сложность уровня - i % --cycle: уровней в наборе могут быть
+тысячи, а сложность повторяется по кругу, как в обычной игре.
+
+Каждый уровень проверяется: соседние платформы достижимы друг из друга
+(can_reach), монетка над каждой платформой достижима (coin_is_reachable).
+Отдельно считаются платформы, которые не поместились по высоте экрана
+(generation.max_platforms). Уровни с ошибками проверки в набор не
+попадают - команда завершается с кодом 1 и ничего не пишет.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .generation import can_reach, coin_is_reachable, generate_random_level, max_platforms
+from .levelpack import LevelPack, level_records, write_pack
+from .levels import level_seed
+from .settings import HEIGHT, NUM_LEVELS
+
+MAX_REPORTED = 20  # сколько ошибок печатать подробно
+
+
+def validate_level(level):
+    """Список ошибок уровня из спрайтов; пустой - уровень проходим."""
+    platforms = level["platforms"]
+    coins = level["coins"]
+    problems = []
+    if len(coins) != len(platforms) - 1:
+        problems.append(f"{len(platforms)} платформ, но {len(coins)} монеток")
+    for k in range(1, len(platforms)):
+        if not can_reach(platforms[k - 1], platforms[k]):
+            problems.append(f"платформа {k} {tuple(platforms[k].rect)} недостижима с {k - 1}")
+        if k - 1 < len(coins) and not coin_is_reachable(platforms[k], coins[k - 1]):
+            problems.append(f"монетка {k - 1} {coins[k - 1].rect.center} недостижима с платформы {k}")
+    return problems
+
+
+def _generate(job):
+    """Работа одного процесса: (i, зерно, сложность) -> записи уровня и итог проверки."""
+    i, seed, level_num = job
+    level = generate_random_level(level_num, random.Random(seed))
+    return i, level_records(level), level["skipped"], validate_level(level)
+
+
+_packs = {}  # открытые наборы в процессе-работнике
+
+
+def _check(job):
+    path, i = job
+    pack = _packs.get(path)
+    if pack is None:
+        pack = _packs[path] = LevelPack(path)
+    return i, validate_level(pack[i])
+
+
+def _run(executor, workers, fn, jobs, total):
+    """Результаты по мере готовности с прогрессом в stderr; порядок - как у jobs."""
+    chunksize = max(1, total // (workers * 16))
+    for done, result in enumerate(executor.map(fn, jobs, chunksize=chunksize), 1):
+        if done % 500 == 0 or done == total:
+            print(f"\r  {done}/{total}", end="", file=sys.stderr, flush=True)
+        yield result
+    print(file=sys.stderr)
+
+
+def _print_problems(failed):
+    for i, problems in failed[:MAX_REPORTED]:
+        for problem in problems:
+            print(f"  уровень {i}: {problem}")
+    if len(failed) > MAX_REPORTED:
+        print(f"  ... и ещё {len(failed) - MAX_REPORTED} уровней с ошибками")
+
+
+def build(path, num_levels, seed, cycle, workers):
+    jobs = [(i, level_seed(seed, i), i % cycle) for i in range(num_levels)]
+    records = [None] * num_levels
+    skipped = [0] * num_levels
+    failed = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, level, level_skipped, problems in _run(executor, workers, _generate, jobs, num_levels):
+            records[i] = level
+            skipped[i] = level_skipped
+            if problems:
+                failed.append((i, problems))
+    elapsed = time.perf_counter() - start
+
+    platforms = sum(len(level[0]) - 1 for level in records)
+    wanted = sum(3 + job[2] * 2 for job in jobs)
+    print(f"Уровней: {num_levels} за {elapsed:.2f} с ({num_levels / elapsed:.0f} уровней/с, "
+          f"{workers} процессов)")
+    print(f"Платформ: {platforms} из {wanted}; не поместилось по высоте: {sum(skipped)} "
+          f"в {sum(1 for s in skipped if s)} уровнях (на экран - не больше {max_platforms(HEIGHT - 40)})")
+    by_difficulty = {}
+    for job, level_skipped in zip(jobs, skipped):
+        by_difficulty.setdefault(job[2], []).append(level_skipped)
+    for level_num, counts in sorted(by_difficulty.items()):
+        print(f"  сложность {level_num:3}: нужно {3 + level_num * 2:4} платформ, "
+              f"не поместилось в среднем {sum(counts) / len(counts):6.2f}, максимум {max(counts)}")
+    if failed:
+        print(f"Не прошли проверку: {len(failed)} уровней, набор не записан")
+        _print_problems(failed)
+        return 1
+    write_pack(path, records, [job[1] for job in jobs])
+    print(f"Записан {path}: {os.path.getsize(path) / 1024:.0f} КиБ")
+    return 0
+
+
+def check(path, workers):
+    with LevelPack(path) as pack:
+        count = len(pack)
+    failed = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, problems in _run(executor, workers, _check, [(path, i) for i in range(count)], count):
+            if problems:
+                failed.append((i, problems))
+    print(f"Проверено уровней: {count} за {time.perf_counter() - start:.2f} с, с ошибками: {len(failed)}")
+    _print_problems(failed)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pack", help="файл набора уровней")
+    parser.add_argument("--check", action="store_true", help="только проверить готовый набор")
+    parser.add_argument("--levels", type=int, default=1000, help="сколько уровней сгенерировать")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cycle", type=int, default=NUM_LEVELS,
+                        help="сложность уровня i - i %% cycle")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    # Проверяем до генерации: иначе ошибка всплывёт, когда все уровни уже построены
+    if args.cycle < 1:
+        parser.error("--cycle должен быть не меньше 1")
+    if args.workers < 1:
+        parser.error("--workers должен быть не меньше 1")
+    if not args.check:
+        if args.levels < 1:
+            parser.error("--levels должен быть не меньше 1")
+        seeds = (level_seed(args.seed, 0), level_seed(args.seed, args.levels - 1))
+        if not all(-2 ** 63 <= s < 2 ** 63 for s in seeds):
+            parser.error(f"--seed {args.seed}: зёрна уровней не помещаются в 64 бита набора")
+    if args.check:
+        return check(args.pack, args.workers)
+    return build(args.pack, args.levels, args.seed, args.cycle, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Замер времени кадра по фазам главного цикла.
+
+Фазы: обработка событий, Player.update, обновление огненных шаров, сбор
+монеток, попадания шаров, отрисовка и display.flip/update. Код цикла
+отмечает конец фазы вызовом mark(phase) - время с предыдущей отметки
+(или lap()) прибавляется к этой фазе текущего кадра; за кадр с несколькими
+шагами физики фазы суммируются. Время, не попавшее ни в одну фазу
+(звуки, интерполяция, смена уровня), идёт в "other".
+
+По последним window кадрам считаются p50/p95/p99; их можно показать
+поверх игры (Renderer рисует draw_overlay) или записать все кадры в
+CSV/JSON (write_trace).
+"""
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+from .settings import WHITE, BLACK
+
+PHASES = ("events", "player", "fireballs", "coins", "hits", "draw", "flip", "other")
+PERCENTILES = (50, 95, 99)
+PROFILE_WINDOW = 300  # кадров в скользящем окне
+OVERLAY_REFRESH = 30  # текст поверх игры пересчитывается раз в столько кадров
+OVERLAY_WIDTH = 250
+OVERLAY_FONT = ("monospace", 14)
+
+
+def percentile(sorted_values, p):
+    """p-й процентиль уже отсортированного списка (ближайший ранг)."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class FrameProfiler:
+    def __init__(self, window=PROFILE_WINDOW, keep_trace=False):
+        self.window = {phase: deque(maxlen=window) for phase in PHASES + ("total",)}
+        self.trace = [] if keep_trace else None
+        self.frames = 0
+        self.overlay = False
+        self._frame = None
+        self._start = 0.0
+        self._last = 0.0
+        self._overlay_lines = None
+        self._overlay_surface = None
+        self._font = None
+
+    def begin_frame(self):
+        """Начало кадра; незаконченный предыдущий кадр (заставка) отбрасывается."""
+        self._frame = dict.fromkeys(PHASES, 0.0)
+        self._start = self._last = time.perf_counter()
+
+    def lap(self):
+        """Сбрасывает отсчёт: время до этого места ни в какую фазу не идёт."""
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        if self._frame is not None:
+            self._frame[phase] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        frame = self._frame
+        if frame is None:
+            return
+        self._frame = None
+        total = (time.perf_counter() - self._start) * 1000
+        frame["other"] = max(0.0, total - sum(frame.values()))
+        frame["total"] = total
+        for phase, ms in frame.items():
+            self.window[phase].append(ms)
+        if self.trace is not None:
+            self.trace.append(frame)
+        self.frames += 1
+
+    def percentiles(self, phase):
+        """(p50, p95, p99) фазы в мс по скользящему окну."""
+        values = sorted(self.window[phase])
+        return tuple(percentile(values, p) for p in PERCENTILES)
+
+    def summary(self):
+        return {phase: dict(zip((f"p{p}" for p in PERCENTILES), self.percentiles(phase)))
+                for phase in self.window}
+
+    def lines(self):
+        lines = [f"{'мс':10}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for phase in PHASES + ("total",):
+            p50, p95, p99 = self.percentiles(phase)
+            lines.append(f"{phase:10}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        return lines
+
+    def print_summary(self):
+        print(f"Профиль кадра (последние {len(self.window['total'])} из {self.frames} кадров):")
+        for line in self.lines():
+            print("  " + line)
+
+    def draw_overlay(self, screen):
+        """Рисует таблицу процентилей в правом верхнем углу; возвращает её прямоугольник.
+
+        Подложка непрозрачная и одного размера, поэтому в режиме dirty её
+        достаточно нарисовать последней - стирать под ней ничего не нужно.
+        """
+        if self._overlay_surface is None or self.frames % OVERLAY_REFRESH == 0:
+            lines = self.lines()
+            if lines != self._overlay_lines or self._overlay_surface is None:
+                self._overlay_lines = lines
+                if self._font is None:
+                    self._font = pygame.font.SysFont(*OVERLAY_FONT)
+                font = self._font
+                height = font.get_linesize()
+                surface = pygame.Surface((OVERLAY_WIDTH, height * len(lines) + 8))
+                surface.fill(BLACK)
+                for i, line in enumerate(lines):
+                    surface.blit(font.render(line, True, WHITE), (6, 4 + i * height))
+                self._overlay_surface = surface
+        rect = self._overlay_surface.get_rect(topright=(screen.get_width() - 10, 10))
+        return screen.blit(self._overlay_surface, rect)
+
+    def write_trace(self, path):
+        """Все записанные кадры в CSV или JSON - по расширению файла."""
+        frames = self.trace or []
+        columns = PHASES + ("total",)
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"phases": columns, "summary": self.summary(),
+                           "frames": [[round(frame[c], 4) for c in columns] for frame in frames]}, f)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(("frame",) + columns)
+                for i, frame in enumerate(frames):
+                    writer.writerow([i] + [f"{frame[c]:.4f}" for c in columns])
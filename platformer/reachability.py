@@ -0,0 +1,148 @@
+"""Достижимость цели прыжком: аналитика вместо пошаговой симуляции.
+
+Прыжок из coin_is_reachable - это sim_steps шагов с постоянной гравитацией:
+после шага k (k = 1..sim_steps) игрок стоит в
+
+    x_k = x0 + k * vx
+    y_k = y0 + k * jump_power + gravity * k * (k - 1) / 2
+
+то есть на параболе. Вместо перебора всех шагов с тестом масок решаем
+квадратное и линейное неравенства и получаем короткий отрезок шагов, на
+которых прямоугольник игрока вообще задевает рамку непрозрачных пикселей
+цели. Маски сравниваются только там, где рамка задета частично.
+"""
+import math
+
+# Координата ближе этого к целому - результат int() может зависеть от
+# порядка сложения float, тогда честно повторяем пошаговую симуляцию
+_TRUNC_EPS = 1e-7
+
+
+def opaque_bounds(mask):
+    """Рамка непрозрачных пикселей маски (x0, y0, x1, y1) включительно или None."""
+    rects = mask.get_bounding_rects()
+    if not rects:
+        return None
+    return (min(r.left for r in rects), min(r.top for r in rects),
+            max(r.right for r in rects) - 1, max(r.bottom for r in rects) - 1)
+
+
+def simulate_jump(start, target, vx, jump_power, gravity, player_mask, target_mask, sim_steps=60):
+    """Эталон: пошаговая симуляция прыжка, как в исходном coin_is_reachable."""
+    x, y = start
+    vy = jump_power
+    for _ in range(sim_steps):
+        x += vx
+        y += vy
+        vy += gravity
+        if player_mask.overlap(target_mask, (int(target[0] - x), int(target[1] - y))):
+            return True
+    return False
+
+
+def _exact(step):
+    """Шаг - двоичная дробь: сумма k шагов и k * шаг совпадут без погрешности."""
+    return float(step * 1024).is_integer()
+
+
+class JumpSolver:
+    """Аналитическая проверка прыжка для фиксированных физики и масок.
+
+    Всё, что не зависит от точки старта и цели, считается один раз:
+    рамка цели, подъём по шагам, коэффициенты параболы.
+    player_mask должна быть сплошной: тогда полностью накрытая рамка
+    цели - уже попадание; иначе reaches() просто повторяет симуляцию.
+    """
+
+    def __init__(self, jump_power, gravity, player_mask, target_mask, sim_steps=60):
+        self.jump_power = jump_power
+        self.gravity = gravity
+        self.player_mask = player_mask
+        self.target_mask = target_mask
+        self.sim_steps = sim_steps
+        self.pw, self.ph = player_mask.get_size()
+        self.bounds = opaque_bounds(target_mask)
+        self.analytic = gravity > 0 and player_mask.count() == self.pw * self.ph
+        self.exact_y = _exact(jump_power) and _exact(gravity)
+        # rise[k] = y_k - y0, сумма шагов в том же порядке, что и в симуляции
+        self.rise = [0.0]
+        vy = jump_power
+        for _ in range(sim_steps):
+            self.rise.append(self.rise[-1] + vy)
+            vy += gravity
+        # f(k) = ty - y_k = a*k^2 + b*k + c
+        self.a = -gravity / 2
+        self.b = gravity / 2 - jump_power
+
+    def simulate(self, start, target, vx):
+        return simulate_jump(start, target, vx, self.jump_power, self.gravity,
+                             self.player_mask, self.target_mask, self.sim_steps)
+
+    def reaches(self, start, target, vx):
+        """То же, что simulate_jump, но без перебора всех шагов.
+
+        start - точка отсчёта игрока, target - левый верхний угол цели.
+        """
+        bounds = self.bounds
+        if bounds is None:
+            return False
+        if not self.analytic:
+            return self.simulate(start, target, vx)
+        bx0, by0, bx1, by1 = bounds
+        pw, ph = self.pw, self.ph
+        x0, y0 = start
+        tx, ty = target
+
+        # Смещение цели p = int(t - pos) задевает рамку, если -b1 <= p <= size - 1 - b0.
+        # int() отбрасывает дробь, поэтому на вещественной оси берём запас в 1 пиксель.
+        # По y: f(k) >= -by1 - 1, парабола ветвями вниз -> один отрезок шагов
+        a, b = self.a, self.b
+        disc = b * b - 4 * a * (ty - y0 + by1 + 1)
+        if disc < 0:
+            return False
+        root = math.sqrt(disc)
+        k_lo = (-b + root) / (2 * a)
+        k_hi = (-b - root) / (2 * a)
+
+        # По x: tx - x_k линейна по k
+        dx = tx - x0
+        if vx:
+            k1 = (dx + bx1 + 1) / vx
+            k2 = (dx - pw + bx0) / vx
+            if k1 > k2:
+                k1, k2 = k2, k1
+            if k1 > k_lo:
+                k_lo = k1
+            if k2 < k_hi:
+                k_hi = k2
+            exact_x = _exact(vx)
+        elif -bx1 - 1 <= dx <= pw - bx0:
+            exact_x = True
+        else:
+            return False
+
+        first = max(1, math.floor(k_lo))
+        last = min(self.sim_steps, math.ceil(k_hi))
+        exact_y = self.exact_y
+        rise = self.rise
+        for k in range(first, last + 1):
+            fx = tx - (x0 + k * vx)
+            fy = ty - (y0 + rise[k])
+            if not exact_x and abs(fx - round(fx)) < _TRUNC_EPS or \
+                    not exact_y and abs(fy - round(fy)) < _TRUNC_EPS:
+                return self.simulate(start, target, vx)
+            px = int(fx)
+            py = int(fy)
+            # Окно игрока в координатах цели: [-p, size - p)
+            left = -px if -px > bx0 else bx0
+            right = pw - 1 - px if pw - 1 - px < bx1 else bx1
+            top = -py if -py > by0 else by0
+            bottom = ph - 1 - py if ph - 1 - py < by1 else by1
+            if left > right or top > bottom:
+                continue
+            if left == bx0 and right == bx1 and top == by0 and bottom == by1:
+                return True
+            # Рамка задета частично - решает маска
+            if self.player_mask.overlap(self.target_mask, (px, py)):
+                return True
+        return False
@@ -0,0 +1,284 @@
+"""Отрисовка мира: читает состояние World и рисует его на экран.
+
+Фон и все платформы уровня один раз сводятся в статический слой, который
+пересобирается только при смене уровня. Два режима:
+    full  - каждый кадр статический слой, монетки, огненные шары, игрок,
+            HUD и display.flip();
+    dirty - статический слой рисуется только при смене уровня, а дальше
+            перерисовываются лишь места, где были или стали игрок и огненные
+            шары, исчезнувшие монетки и изменившийся HUD (display.update(rects)).
+"""
+from collections import OrderedDict
+
+import pygame
+
+from . import sprites
+from .settings import WIDTH, HEIGHT, WHITE, BLACK, SKY_BLUE
+
+RENDER_FULL = "full"
+RENDER_DIRTY = "dirty"
+RENDER_MODES = (RENDER_FULL, RENDER_DIRTY)
+
+HUD_POSITIONS = ((10, 10), (10, 40))
+# Сдвиг за шаг больше этого - телепорт (попадание, смена уровня, шар из пула):
+# такой спрайт не интерполируем, а рисуем сразу на новом месте
+TELEPORT_DISTANCE = 100
+TEXT_CACHE_SIZE = 32
+
+# Заставки и сколько они держатся на экране, мс
+BANNER_LEVEL = "level"
+BANNER_GAME_OVER = "game_over"
+BANNER_VICTORY = "victory"
+BANNER_DURATION = {BANNER_LEVEL: 2000, BANNER_GAME_OVER: 2000, BANNER_VICTORY: 3000}
+
+
+class TextCache:
+    """Готовые поверхности текста: font.render() только для новых строк.
+
+    Ограничена max_size строками (LRU); hits/misses показывают, сколько
+    раз текст брался из кэша и сколько раз растеризовался заново.
+    """
+
+    def __init__(self, font, max_size=TEXT_CACHE_SIZE):
+        self.font = font
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, text, color):
+        key = (text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+class Renderer:
+    def __init__(self, screen, font, mode=RENDER_FULL):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Неизвестный режим отрисовки: {mode}")
+        self.screen = screen
+        self.font = font
+        self.text = TextCache(font)
+        self.mode = mode
+        # Фон + платформы текущего уровня одной поверхностью
+        self._static = None
+        self._static_level = None
+        # Что сейчас на экране в режиме dirty
+        self._level = None
+        self._drawn = []
+        self._coins = set()
+        self._hud = None
+        self._hud_rects = []
+        # Позиции движущихся спрайтов до последнего шага мира - для интерполяции
+        self._prev = {}
+        # FrameProfiler или None: отрисовка и flip замеряются отдельно,
+        # а при profiler.overlay поверх кадра рисуется таблица процентилей
+        self.profiler = None
+
+    def invalidate(self):
+        """Экран перерисован кем-то другим - следующий кадр рисуется целиком."""
+        self._level = None
+
+    def remember(self, world):
+        """Запоминает позиции игрока и шаров перед шагом мира."""
+        self._prev = {s: s.rect.topleft for s in world.fireball_group}
+        self._prev[world.player] = world.player.rect.topleft
+
+    def _moving(self, world, alpha):
+        """(спрайт, где его рисовать) для шаров и игрока.
+
+        alpha - доля шага между предыдущим и текущим состоянием мира:
+        физика идёт фиксированными шагами, а кадр может попасть между ними.
+        """
+        sprites = list(world.fireball_group)
+        sprites.append(world.player)
+        placed = []
+        for sprite in sprites:
+            rect = sprite.rect.copy()
+            prev = self._prev.get(sprite)
+            if prev is not None and alpha < 1:
+                dx, dy = rect.x - prev[0], rect.y - prev[1]
+                if abs(dx) <= TELEPORT_DISTANCE and abs(dy) <= TELEPORT_DISTANCE:
+                    rect.topleft = (round(prev[0] + dx * alpha), round(prev[1] + dy * alpha))
+            placed.append((sprite, rect))
+        return placed
+
+    def draw(self, world, alpha=1.0):
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.lap()
+        moving = self._moving(world, alpha)
+        if self.mode == RENDER_DIRTY and self._level is world.level:
+            self._draw_dirty(world, moving)
+        else:
+            self._draw_full(world, moving)
+        if profiler is not None:
+            profiler.mark("flip")
+
+    def _overlay(self):
+        """Таблица профилировщика поверх кадра; отметка конца фазы отрисовки."""
+        profiler = self.profiler
+        if profiler is None:
+            return []
+        rects = [profiler.draw_overlay(self.screen)] if profiler.overlay else []
+        profiler.mark("draw")
+        return rects
+
+    def _static_layer(self, world):
+        """Фон и платформы уровня, сведённые в одну поверхность."""
+        if self._static_level is not world.level:
+            sprites.load_images()
+            layer = sprites.BACKGROUND_IMG.copy()
+            world.platform_group.draw(layer)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            self._static = layer
+            self._static_level = world.level
+        return self._static
+
+    def _hud_texts(self, world):
+        return (f"Счёт: {world.score}", f"Жизни: {world.lives}")
+
+    def _blit_hud(self, world):
+        texts = self._hud_texts(world)
+        self._hud = texts
+        self._hud_rects = [self.screen.blit(self.text.render(text, BLACK), pos)
+                           for text, pos in zip(texts, HUD_POSITIONS)]
+        return self._hud_rects
+
+    def _draw_full(self, world, moving):
+        screen = self.screen
+        screen.blit(self._static_layer(world), (0, 0))
+        world.coin_group.draw(screen)
+        for sprite, rect in moving:
+            screen.blit(sprite.image, rect)
+        self._blit_hud(world)
+        self._overlay()
+        pygame.display.flip()
+
+        self._level = world.level
+        self._drawn = [rect for _, rect in moving]
+        self._coins = set(world.coin_group)
+
+    def _clear(self, rect, world):
+        """Возвращает под rect фон с платформами."""
+        screen = self.screen
+        # area с отрицательными координатами blit обрезает, но не сдвигает - обрезаем сами
+        rect = rect.clip(screen.get_rect())
+        screen.blit(self._static_layer(world), rect, rect)
+
+    def _draw_dirty(self, world, moving):
+        screen = self.screen
+        new = [rect for _, rect in moving]
+
+        dirty = list(self._drawn)
+        coins = set(world.coin_group)
+        dirty += [c.rect for c in self._coins - coins]
+        self._coins = coins
+
+        # Задетую монетку стираем целиком: полупрозрачные края нельзя рисовать дважды
+        touched = [c for c in coins if c.rect.collidelist(dirty) != -1]
+        dirty += [c.rect for c in touched]
+        # HUD рисуется поверх всего: если под ним что-то меняется, его надо обновить
+        redraw_hud = self._hud != self._hud_texts(world) or any(
+            r.collidelist(dirty + new) != -1 for r in self._hud_rects)
+        if redraw_hud:
+            dirty += self._hud_rects
+            more = [c for c in coins if c not in touched and c.rect.collidelist(self._hud_rects) != -1]
+            touched += more
+            dirty += [c.rect for c in more]
+
+        for rect in dirty:
+            self._clear(rect, world)
+        for coin in touched:
+            screen.blit(coin.image, coin.rect)
+        for sprite, rect in moving:
+            screen.blit(sprite.image, rect)
+        if redraw_hud:
+            dirty += self._blit_hud(world)
+        dirty += self._overlay()
+
+        pygame.display.update(dirty + new)
+        self._drawn = new
+
+    def prepare(self, world):
+        """Заранее готовит всё тяжёлое для уровня (статический слой) - например, под заставкой."""
+        self._static_layer(world)
+
+    def draw_banner(self, banner, world):
+        """Заставка поверх игры: уровень, конец игры или победа."""
+        screen = self.screen
+        if banner == BANNER_LEVEL:
+            screen.fill(SKY_BLUE)
+            screen.blit(self.text.render(f"Уровень {world.current_level + 1}", BLACK), (WIDTH // 2 - 60, HEIGHT // 2))
+        elif banner == BANNER_GAME_OVER:
+            screen.fill(BLACK)
+            screen.blit(self.text.render("Game Over", WHITE), (WIDTH // 2 - 60, HEIGHT // 2))
+        else:
+            screen.fill(SKY_BLUE)
+            screen.blit(self.text.render("🎉 Победа!", BLACK), (WIDTH // 2 - 100, HEIGHT // 2))
+        pygame.display.flip()
+        self.invalidate()
+
+
+class ScrollingRenderer(Renderer):
+    """Отрисовка башни (TowerWorld) со сдвигом камеры.
+
+    Камера двигается почти каждый кадр, поэтому кадр всегда рисуется
+    целиком: фон, сведённые картинки платформ тех кусков, что в памяти,
+    монетки, шары, игрок и HUD. Сдвиг камеры интерполируется так же, как
+    позиции спрайтов.
+    """
+
+    def __init__(self, screen, font):
+        super().__init__(screen, font, RENDER_FULL)
+        self._background = None
+
+    def _hud_texts(self, world):
+        return (f"Счёт: {world.score}", f"Жизни: {world.lives}   Высота: {max(0, world.height) // 10} м")
+
+    def prepare(self, world):
+        for chunk in world.resident:
+            chunk.layer()
+
+    def draw(self, world, alpha=1.0):
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.lap()
+        screen = self.screen
+        camera = world.camera
+        offset = round(camera.prev_y + (camera.y - camera.prev_y) * alpha)
+        view = screen.get_rect().move(0, offset)
+
+        if self._background is None:
+            sprites.load_images()
+            background = sprites.BACKGROUND_IMG
+            if pygame.display.get_surface() is not None:
+                background = background.convert()
+            self._background = background
+        screen.blit(self._background, (0, 0))
+        for chunk in world.resident:
+            if chunk.bottom > view.top and chunk.top < view.bottom:
+                screen.blit(chunk.layer(), (0, chunk.top - offset))
+        for coin in world.coin_group:
+            if view.colliderect(coin.rect):
+                screen.blit(coin.image, coin.rect.move(0, -offset))
+        for sprite, rect in self._moving(world, alpha):
+            screen.blit(sprite.image, rect.move(0, -offset))
+        self._blit_hud(world)
+        self._overlay()
+        pygame.display.flip()
+        if profiler is not None:
+            profiler.mark("flip")
@@ -0,0 +1,150 @@
+"""Запись и воспроизведение ввода: одинаковые прогоны для замеров и регрессий.
+
+Мир детерминирован: уровни и огненные шары берутся из seed, время -
+из числа шагов. Поэтому для повтора партии достаточно seed (и набора
+уровней, если играли его) и того, что было нажато на каждом шаге физики.
+
+    python -m platformer --record game.rpl --seed 42
+    python -m platformer.replay game.rpl --repeat 5
+
+Формат файла (little-endian):
+
+    заголовок  <4sHHQI   magic b"RPLY", версия, флаги, seed, число шагов
+    итог       <iiiiiB   счёт, жизни, x и y игрока, уровень, состояние
+    набор      <H + utf-8 путь к набору уровней (длина 0 - уровни генерировались)
+    ввод       zlib от байта на шаг: биты A, D, SPACE, ESC
+
+ESC (пауза) на физику не влияет - пока игра на паузе, шагов нет, - но
+бит сохраняется, чтобы было видно, где игрок останавливался.
+"""
+import argparse
+import struct
+import sys
+import time
+import zlib
+
+MAGIC = b"RPLY"
+VERSION = 2  # 2: новый generate_random_level - по seed строятся другие уровни
+HEADER = struct.Struct("<4sHHQI")
+FINAL = struct.Struct("<iiiiiB")
+PATH_LEN = struct.Struct("<H")
+
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_PAUSE = 8
+
+STATES = ("playing", "game_over", "victory")
+
+
+def input_bits(left, right, jump, pause=False):
+    return (INPUT_LEFT * bool(left) | INPUT_RIGHT * bool(right)
+            | INPUT_JUMP * bool(jump) | INPUT_PAUSE * bool(pause))
+
+
+def input_direction(bits):
+    """Направление как в игровом цикле: D важнее A."""
+    return 1 if bits & INPUT_RIGHT else -1 if bits & INPUT_LEFT else 0
+
+
+def final_state(world):
+    """То, что сверяется после повтора: счёт, жизни, позиция, уровень, состояние."""
+    return (world.score, world.lives, world.player.rect.x, world.player.rect.y,
+            world.current_level, STATES.index(world.state))
+
+
+class Recorder:
+    """Копит ввод по шагам физики; save() пишет его вместе с итогом партии."""
+
+    def __init__(self, seed, pack=None):
+        self.seed = seed
+        self.pack = pack
+        self.inputs = bytearray()
+
+    def tick(self, left, right, jump, pause=False):
+        self.inputs.append(input_bits(left, right, jump, pause))
+
+    def save(self, path, world):
+        pack = (self.pack or "").encode("utf-8")
+        # Всё собирается до открытия файла: ошибка упаковки не оставит обрезанную запись
+        data = b"".join([
+            HEADER.pack(MAGIC, VERSION, 0, self.seed, len(self.inputs)),
+            FINAL.pack(*final_state(world)),
+            PATH_LEN.pack(len(pack)) + pack,
+            zlib.compress(bytes(self.inputs), 9),
+        ])
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+class Replay:
+    def __init__(self, seed, inputs, expected, pack=None):
+        self.seed = seed
+        self.inputs = inputs
+        self.expected = expected
+        self.pack = pack
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, _, seed, ticks = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: не запись ввода (magic={magic!r}, версия {version})")
+        offset = HEADER.size
+        expected = FINAL.unpack_from(data, offset)
+        offset += FINAL.size
+        (length,) = PATH_LEN.unpack_from(data, offset)
+        offset += PATH_LEN.size
+        pack = data[offset:offset + length].decode("utf-8") or None
+        inputs = zlib.decompress(data[offset + length:])
+        if len(inputs) != ticks:
+            raise ValueError(f"{path}: записано {len(inputs)} шагов вместо {ticks}")
+        return cls(seed, inputs, expected, pack)
+
+    def world(self):
+        from .world import World
+        if self.pack:
+            from .levelpack import LevelPack
+            return World(levels=LevelPack(self.pack), seed=self.seed)
+        return World(seed=self.seed)
+
+    def play(self, world=None):
+        """Прогоняет весь ввод без окна и задержек. Возвращает (мир, секунды)."""
+        world = world or self.world()
+        step = world.step
+        start = time.perf_counter()
+        for bits in self.inputs:
+            step(input_direction(bits), bits & INPUT_JUMP)
+        return world, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("replay", help="файл записи (python -m platformer --record)")
+    parser.add_argument("--repeat", type=int, default=1, help="сколько раз прогнать для замера")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat должен быть не меньше 1")
+
+    replay = Replay.load(args.replay)
+    times = []
+    for _ in range(args.repeat):
+        world, elapsed = replay.play()
+        times.append(elapsed)
+        got = final_state(world)
+        if got != replay.expected:
+            names = ("счёт", "жизни", "x", "y", "уровень", "состояние")
+            diff = ", ".join(f"{n}: {e} -> {g}" for n, e, g in zip(names, replay.expected, got) if e != g)
+            print(f"Расхождение после {len(replay.inputs)} шагов: {diff}")
+            return 1
+    best = max(min(times), 1e-9)
+    print(f"Шагов: {len(replay.inputs)}, seed {replay.seed}; итог совпал "
+          f"(счёт {world.score}, жизни {world.lives}, уровень {world.current_level + 1})")
+    print(f"Лучшее время из {len(times)}: {best * 1000:.1f} мс "
+          f"({len(replay.inputs) / best:.0f} шагов/с, {best / max(1, len(replay.inputs)) * 1e6:.1f} мкс/шаг)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""Сервер игры по сети: один мир на всех, клиенты присылают ввод и получают снимки.
+
+    python -m platformer.server --port 5555
+    python -m platformer.server --bots 50 --seconds 10   # сервер и боты в одном процессе
+
+Сервер - единственный, кто считает физику: MultiWorld шагает теми же
+правилами, что и World (Player.update, огненные шары из пула, и для
+каждого игрока - те же World.take_coins и World.fireball_hits), только
+игроков несколько. Каждые snapshot_every шагов
+состояние мира рассылается клиентам дельтой к последнему снимку, который
+клиент подтвердил (net.py). Состояние собирается один раз за снимок, а
+дельта к одной и той же базе кодируется один раз на всех клиентов с этой
+базой, поэтому стоимость снимка почти не растёт с числом клиентов.
+Медленному клиенту (неотправленных данных больше MAX_WRITE_BUFFER) снимок
+пропускается - следующий всё равно придёт дельтой к тому, что он видел.
+"""
+import argparse
+import asyncio
+import struct
+import sys
+import time
+from collections import OrderedDict
+
+from . import net
+from .levelpack import level_records
+from .profiler import percentile
+from .replay import INPUT_JUMP, input_direction
+from .settings import FPS, START_LIVES, PLAYER_START, WIDTH, MAX_STEPS_PER_FRAME
+from .sprites import Player
+from .world import World, PLAYING, EVENT_JUMP, EVENT_COIN, EVENT_HURT, EVENT_LEVEL, EVENT_VICTORY
+
+DEFAULT_PORT = 5555
+SNAPSHOT_EVERY = 2  # снимок раз в столько шагов физики (30 в секунду)
+SNAPSHOT_HISTORY = 64  # сколько последних снимков годятся в базу дельты
+MAX_WRITE_BUFFER = 64 * 1024
+REPORT_EVERY = 5.0  # с
+
+
+class NetPlayer:
+    def __init__(self, ident):
+        self.ident = ident
+        self.sprite = Player(*PLAYER_START)
+        self.score = 0
+        self.lives = START_LIVES
+        self.out = False
+        self.bits = 0
+        self.jump = False
+
+    def respawn(self):
+        self.sprite.rect.topleft = PLAYER_START
+        self.sprite.vel_y = 0
+
+
+class MultiWorld(World):
+    """World на несколько игроков.
+
+    Монетки и огненные шары общие, счёт и жизни - у каждого свои. Игрок без
+    жизней выбывает до конца раунда; раунд начинается заново, когда выбыли
+    все или пройден последний уровень. События шага - пары (игрок, событие).
+    """
+
+    def __init__(self, levels=None, seed=None, dt_ms=1000 / FPS):
+        self.players = OrderedDict()
+        self._next_id = 1
+        self.tick = 0
+        super().__init__(levels, seed, dt_ms)
+        # Одиночный игрок World здесь не участвует - игроки в self.players
+        self.player = None
+        self.player_group.empty()
+
+    def load_level(self, i):
+        super().load_level(i)
+        self.coin_ids = {coin: n for n, coin in enumerate(self.level["coins"])}
+
+    def join(self):
+        player = NetPlayer(self._next_id)
+        self._next_id += 1
+        self.players[player.ident] = player
+        return player.ident
+
+    def leave(self, ident):
+        self.players.pop(ident, None)
+
+    def set_input(self, ident, bits):
+        player = self.players.get(ident)
+        if player is not None:
+            player.bits = bits
+            # Нажатие прыжка держится до ближайшего шага, даже если бит уже сброшен
+            player.jump = player.jump or bool(bits & INPUT_JUMP)
+
+    def reset_round(self):
+        self.current_level = 0
+        self.load_level(0)
+        self.state = PLAYING
+        for player in self.players.values():
+            player.score = 0
+            player.lives = START_LIVES
+            player.out = False
+            player.respawn()
+
+    def step(self, direction=0, jump=False):
+        """Шаг для всех игроков сразу; direction и jump не используются - ввод у игроков."""
+        self.events = []
+        self.tick += 1
+        self.time_ms += self.dt_ms
+        active = [p for p in self.players.values() if not p.out]
+
+        for player in active:
+            if player.jump and player.sprite.jump():
+                self.events.append((player.ident, EVENT_JUMP))
+            player.jump = False
+            player.sprite.update(input_direction(player.bits), self.time_ms, self.platform_index)
+        self.fireball_group.update()
+        self.platform_group.update()
+
+        self.narrow_tests = 0
+        self.narrow_skipped = 0
+        for player in active:
+            taken = self.take_coins(player.sprite)
+            player.score += 10 * taken
+            self.events += [(player.ident, EVENT_COIN)] * taken
+
+        if self.time_ms - self.last_fireball_time > self.level["fireball_interval"]:
+            self.fireball_group.spawn(self.rng.randint(0, WIDTH - 30))
+            self.last_fireball_time = self.time_ms
+
+        for player in active:
+            self.fireball_hits(player.sprite, lambda: self._hit_player(player))
+
+        if self.players and all(p.out for p in self.players.values()):
+            self.reset_round()
+        elif not self.coin_group:
+            if self.current_level < len(self.levels) - 1:
+                self.current_level += 1
+                self.load_level(self.current_level)
+                for player in self.players.values():
+                    player.respawn()
+                self.events.append((0, EVENT_LEVEL))
+            else:
+                self.events.append((0, EVENT_VICTORY))
+                self.reset_round()
+        return self.events
+
+    def _hit_player(self, player):
+        """Попадание шара, как World._hit: минус жизнь и перенос на точку возрождения."""
+        player.lives -= 1
+        if player.sprite.take_hit(self.time_ms):
+            self.events.append((player.ident, EVENT_HURT))
+        player.sprite.rect.topleft = self.spawn_point
+        player.out = player.lives <= 0
+
+    def snapshot(self):
+        """Состояние для клиентов: (вид, номер) -> кортеж чисел."""
+        state = {}
+        for player in self.players.values():
+            rect = player.sprite.rect
+            flags = net.PLAYER_BURNED * player.sprite.burned | net.PLAYER_OUT * player.out
+            state[net.KIND_PLAYER, player.ident] = (rect.x, rect.y, player.score, max(0, player.lives), flags)
+        coin_ids = self.coin_ids
+        for coin in self.coin_group:
+            state[net.KIND_COIN, coin_ids[coin]] = ()
+        for fireball in self.fireball_group:
+            state[net.KIND_FIREBALL, fireball.slot] = (fireball.rect.x, fireball.rect.y)
+        return state
+
+
+class Connection:
+    def __init__(self, ident, writer):
+        self.ident = ident
+        self.writer = writer
+        self.ack = 0
+        self.level = None
+
+
+class GameServer:
+    def __init__(self, world, host="127.0.0.1", port=DEFAULT_PORT, snapshot_every=SNAPSHOT_EVERY):
+        self.world = world
+        self.host = host
+        self.port = port
+        self.snapshot_every = snapshot_every
+        self.clients = {}
+        self.history = OrderedDict()
+        self.server = None
+        self._handlers = set()
+        self.tick_ms = []
+        self.stats = {"bytes": 0, "full": 0, "delta": 0, "skipped": 0, "encoded": 0}
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _serve(self, reader, writer):
+        self._handlers.add(asyncio.current_task())
+        try:
+            kind, _ = await net.read_frame(reader)
+            if kind != net.MSG_HELLO:
+                return
+            ident = self.world.join()
+            conn = Connection(ident, writer)
+            self.clients[ident] = conn
+            writer.write(net.frame(net.MSG_WELCOME, net.WELCOME.pack(ident)))
+            try:
+                while True:
+                    kind, body = await net.read_frame(reader)
+                    if kind == net.MSG_INPUT:
+                        _, ack, bits = net.INPUT.unpack(body)
+                        conn.ack = max(conn.ack, ack)
+                        self.world.set_input(ident, bits)
+            finally:
+                self.clients.pop(ident, None)
+                self.world.leave(ident)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (struct.error, IndexError) as e:
+            # Испорченное сообщение (пустой кадр, тело не того размера) - закрываем только это соединение
+            print(f"Клиент {writer.get_extra_info('peername')}: неверное сообщение ({e}), соединение закрыто")
+        finally:
+            writer.close()
+            self._handlers.discard(asyncio.current_task())
+
+    def broadcast(self):
+        world = self.world
+        state = world.snapshot()
+        tick = world.tick
+        self.history[tick] = state
+        while len(self.history) > SNAPSHOT_HISTORY:
+            self.history.popitem(last=False)
+
+        encoded = {}
+        level_message = None
+        for conn in list(self.clients.values()):
+            writer = conn.writer
+            if conn.level is not world.level:
+                if level_message is None:
+                    level_message = net.encode_level(world.current_level, level_records(world.level))
+                writer.write(level_message)
+                conn.level = world.level
+            elif writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                self.stats["skipped"] += 1
+                continue
+            base_tick = conn.ack if conn.ack in self.history else 0
+            data = encoded.get(base_tick)
+            if data is None:
+                changed, removed = net.diff(self.history[base_tick] if base_tick else {}, state)
+                data = net.encode_snapshot(tick, base_tick, world.current_level, changed, removed)
+                encoded[base_tick] = data
+                self.stats["encoded"] += 1
+            writer.write(data)
+            self.stats["full" if base_tick == 0 else "delta"] += 1
+            self.stats["bytes"] += len(data)
+
+    async def run(self, seconds=None):
+        loop = asyncio.get_running_loop()
+        dt = self.world.dt_ms / 1000
+        start = next_step = loop.time()
+        next_report = start + REPORT_EVERY
+        while seconds is None or loop.time() - start < seconds:
+            steps = 0
+            while loop.time() >= next_step and steps < MAX_STEPS_PER_FRAME:
+                begin = time.perf_counter()
+                self.world.step()
+                if self.world.tick % self.snapshot_every == 0:
+                    self.broadcast()
+                self.tick_ms.append((time.perf_counter() - begin) * 1000)
+                next_step += dt
+                steps += 1
+            # Не успеваем - отстаём, а не копим долг
+            if steps == MAX_STEPS_PER_FRAME:
+                next_step = loop.time() + dt
+            if loop.time() >= next_report:
+                self.report(loop.time() - start)
+                next_report += REPORT_EVERY
+            await asyncio.sleep(max(0.0, next_step - loop.time()))
+
+    def report(self, elapsed):
+        times = sorted(self.tick_ms[-1000:])
+        stats = self.stats
+        sent = stats["full"] + stats["delta"]
+        print(f"[{elapsed:6.1f} с] клиентов {len(self.clients)}, шаг p50 {percentile(times, 50):.2f} "
+              f"p99 {percentile(times, 99):.2f} мс, отправлено {stats['bytes'] / 1024:.0f} КиБ "
+              f"({sent} снимков: {stats['full']} полных, {stats['delta']} дельт, "
+              f"{stats['skipped']} пропущено, закодировано {stats['encoded']})")
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+        # Закрытое соединение даёт обработчику конец потока - ждём, пока он выйдет сам
+        for conn in list(self.clients.values()):
+            conn.writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+
+async def serve(args):
+    server = GameServer(MultiWorld(seed=args.seed), args.host, args.port, args.snapshot_every)
+    await server.start()
+    started = time.perf_counter()
+    print(f"Сервер слушает {server.host}:{server.port}")
+    tasks = [asyncio.create_task(server.run(args.seconds))]
+    if args.bots:
+        from .client import run_bots
+        tasks.append(asyncio.create_task(run_bots(server.host, server.port, args.bots, args.seconds)))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        server.report(time.perf_counter() - started)
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 - любой свободный")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--snapshot-every", type=int, default=SNAPSHOT_EVERY,
+                        help="рассылать снимок раз в столько шагов физики")
+    parser.add_argument("--seconds", type=float, help="остановиться через столько секунд")
+    parser.add_argument("--bots", type=int, default=0, help="запустить столько ботов-клиентов рядом")
+    args = parser.parse_args(argv)
+    if args.snapshot_every < 1:
+        parser.error("--snapshot-every должен быть не меньше 1")
+    if args.bots and args.seconds is None:
+        args.seconds = 10.0
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+# --- Настройки ---
+WIDTH, HEIGHT = 800, 600
+FPS = 60  # шагов физики в секунду; скорости и гравитация - на один шаг
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+SKY_BLUE = (135, 206, 235)
+
+# Физика
+gravity = 0.5
+jump_power = -10
+player_speed = 5
+
+# Ограничения
+MAX_JUMP_HEIGHT = 90
+MAX_HORIZONTAL_DISTANCE = 200
+MIN_VERTICAL_PLATFORM_GAP = 60
+
+# Игра
+NUM_LEVELS = 10
+START_LIVES = 3
+PLAYER_START = (100, 500)
+BURN_DURATION = 2000  # мс, сколько игрок остаётся "сгоревшим"
+FIREBALL_POOL_SIZE = 256  # больше огненных шаров одновременно не бывает
+
+# Высокие уровни (башня): мир режется на куски по высоте, в памяти - только ближние
+CHUNK_HEIGHT = 600
+CHUNKS_BEHIND = 1  # кусков ниже камеры
+CHUNKS_AHEAD = 2  # кусков выше камеры, которые строятся заранее
+CAMERA_FOLLOW = 0.15  # доля расстояния до цели, которую камера проходит за шаг
+TOWER_PLATFORMS = 1000
+TOWER_FIREBALL_INTERVAL = 3000  # мс
+
+# Звук: сколько каналов микшера у каждого звука и как часто его можно повторять
+AUDIO_CHANNELS = {"jump": 1, "coin": 2, "hurt": 1, "game_over": 1}
+SOUND_REPEAT_MS = 50
+
+# Игровой цикл
+MAX_FRAME_MS = 250  # кадр дольше этого считается таким: после зависания не догоняем бесконечно
+MAX_STEPS_PER_FRAME = 5  # больше шагов физики за один кадр не делаем
@@ -0,0 +1,52 @@
+"""Пространственный индекс спрайтов (платформ, монеток) для проверки столкновений."""
+
+CELL_SIZE = 128
+
+
+class SpriteGrid:
+    """Равномерная сетка неподвижных спрайтов, строится один раз при загрузке уровня.
+
+    Каждый спрайт записывается во все ячейки, которые он задевает.
+    query(rect) возвращает только спрайты из ячеек под rect и в том же
+    порядке, в каком они шли в исходной группе: Player.update приземляет
+    игрока на первую подходящую платформу, и порядок должен сохраниться.
+    """
+
+    def __init__(self, sprites, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+        for order, sprite in enumerate(sprites):
+            for key in self._cells_for(sprite.rect):
+                self.cells.setdefault(key, []).append((order, sprite))
+            self.count += 1
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        # right/bottom не входят в прямоугольник, поэтому берём последний пиксель
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cx, cy
+
+    def query(self, rect):
+        """Спрайты, которые могут пересекаться с rect, в исходном порядке."""
+        found = None
+        single = None
+        for key in self._cells_for(rect):
+            bucket = self.cells.get(key)
+            if not bucket:
+                continue
+            if single is None and found is None:
+                single = bucket
+                continue
+            if found is None:
+                found = dict(single)
+            found.update(bucket)
+        if found is not None:
+            return [found[order] for order in sorted(found)]
+        if single is not None:
+            return [sprite for _, sprite in single]
+        return []
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,230 @@
+"""Спрайты и их физика: игрок, платформы, монетки, огненные шары.
+
+Картинки и маски загружаются не при импорте, а при создании первого
+спрайта (load_images): модуль можно импортировать в инструментах и
+пакетных прогонах без окна и без чтения файлов.
+"""
+import threading
+
+import pygame
+
+from .assets import assets, IMAGES
+from .masks import mask_cache
+from .reachability import JumpSolver
+from .settings import (WIDTH, HEIGHT, gravity, jump_power, player_speed,
+                       BURN_DURATION, FIREBALL_POOL_SIZE)
+
+# Заполняются load_images()
+BACKGROUND_IMG = None
+PLAYER_NORMAL_IMG = None
+PLAYER_BURNED_IMG = None
+COIN_IMG = None
+FIREBALL_IMG = None
+PLAYER_MASK = None
+COIN_MASK = None
+FIREBALL_MASK = None
+PLAYER_FULL_MASK = None
+COIN_JUMP = None
+
+_load_lock = threading.Lock()
+
+
+# --- Загрузка изображений ---
+def load_image(path, fallback_size):
+    # Если игра уже запустила фоновую загрузку, картинка берётся готовой из кэша
+    return assets.image(path, fallback_size)
+
+
+def load_images():
+    """Загружает картинки и строит маски; повторные вызовы ничего не делают.
+
+    Уровни могут строиться в фоновом потоке, поэтому загрузка под замком.
+    """
+    global BACKGROUND_IMG, PLAYER_NORMAL_IMG, PLAYER_BURNED_IMG, COIN_IMG, FIREBALL_IMG
+    global PLAYER_MASK, COIN_MASK, FIREBALL_MASK, PLAYER_FULL_MASK, COIN_JUMP
+    if COIN_JUMP is not None:
+        return
+    with _load_lock:
+        if COIN_JUMP is not None:
+            return
+        BACKGROUND_IMG = load_image(*IMAGES["background"])
+        PLAYER_NORMAL_IMG = load_image(*IMAGES["player"])
+        PLAYER_BURNED_IMG = load_image(*IMAGES["player_burned"])
+        COIN_IMG = load_image(*IMAGES["coin"])
+        FIREBALL_IMG = load_image(*IMAGES["fireball"])
+
+        # Все маски строятся один раз, дальше берутся из кэша
+        mask_cache.precompute(PLAYER_NORMAL_IMG, PLAYER_BURNED_IMG, COIN_IMG, FIREBALL_IMG)
+        PLAYER_MASK = mask_cache.get(PLAYER_NORMAL_IMG)
+        COIN_MASK = mask_cache.get(COIN_IMG)
+        FIREBALL_MASK = mask_cache.get(FIREBALL_IMG)
+        PLAYER_FULL_MASK = mask_cache.full(PLAYER_NORMAL_IMG.get_size())
+        COIN_JUMP = JumpSolver(jump_power, gravity, PLAYER_FULL_MASK, COIN_MASK)
+
+
+# --- Классы ---
+class Player(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        load_images()
+        self.image = PLAYER_NORMAL_IMG
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.mask = PLAYER_MASK
+        self.vel_y = 0
+        self.on_ground = False
+        self.burned = False
+        self.burned_time = 0
+        self.platform_dx = 0  # Добавлено из второй версии
+
+    def update(self, direction, now, platform_index):
+        """Один шаг физики: direction -1/0/1, now - время мира в мс.
+
+        platform_index - SpriteGrid платформ уровня: проверяются только
+        платформы рядом с игроком.
+        """
+        # Проверяем, если игрок "сгорел", и прошло больше 2 секунд, сбрасываем состояние
+        if self.burned and now - self.burned_time >= BURN_DURATION:
+            self.image = PLAYER_NORMAL_IMG
+            self.mask = mask_cache.get(self.image)
+            self.burned = False
+
+        dx = direction * player_speed
+
+        # Добавляем силу тяжести
+        self.vel_y += gravity
+        dy = self.vel_y
+        self.on_ground = False
+
+        # Проверка столкновений с платформами
+        future_rect = self.rect.move(0, dy)
+        for platform in platform_index.query(future_rect):
+            if platform.rect.colliderect(future_rect):
+                # Игрок падает сверху на платформу
+                if self.vel_y > 0 and self.rect.bottom <= platform.rect.top + 10:
+                    dy = platform.rect.top - self.rect.bottom
+                    self.vel_y = 0
+                    self.on_ground = True
+
+        # Обновляем позицию игрока
+        self.rect.x += dx
+        self.rect.x = max(0, min(WIDTH - self.rect.width, self.rect.x))
+        self.rect.y += dy
+        self.rect.y = min(HEIGHT - self.rect.height, self.rect.y)
+
+    def jump(self):
+        """Прыжок с земли. Возвращает True, если прыжок состоялся."""
+        if self.on_ground:
+            self.vel_y = jump_power
+            return True
+        return False
+
+    def take_hit(self, now):
+        """Попадание огненного шара. Возвращает True, если игрок только что сгорел."""
+        if not self.burned:
+            self.image = PLAYER_BURNED_IMG
+            self.mask = mask_cache.get(self.image)
+            self.burned = True
+            self.burned_time = now
+            return True
+        return False
+
+
+class Platform(pygame.sprite.Sprite):
+    def __init__(self, x, y, w, h):
+        super().__init__()
+        self.image = pygame.Surface((w, h))
+        self.image.fill((100, 100, 100))
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+class Coin(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        load_images()
+        self.image = COIN_IMG
+        self.rect = self.image.get_rect(center=(x, y))
+        self.mask = COIN_MASK
+
+
+class Fireball(pygame.sprite.Sprite):
+    def __init__(self, x):
+        super().__init__()
+        load_images()
+        self.image = FIREBALL_IMG
+        self.rect = self.image.get_rect(center=(x, 0))
+        self.mask = FIREBALL_MASK
+        self.speed = 5
+
+    def reset(self, x):
+        """Возвращает шар наверх экрана, как новый Fireball(x)."""
+        self.rect.center = (x, 0)
+
+    def update(self):
+        self.rect.y += self.speed
+        if self.rect.top > HEIGHT:
+            self.kill()
+
+
+class FireballPool(pygame.sprite.Group):
+    """Группа огненных шаров с заранее созданными экземплярами.
+
+    spawn() берёт шар из списка свободных вместо создания нового спрайта,
+    а шар, покинувший группу (улетел за экран, empty(), kill()), снова
+    становится свободным. Больше capacity шаров одновременно не бывает:
+    лишние spawn() возвращают None и считаются в dropped. Шар, опустившийся
+    ниже floor, улетел за экран (у прокручиваемого мира floor двигается с камерой).
+    """
+
+    def __init__(self, capacity=FIREBALL_POOL_SIZE):
+        super().__init__()
+        self.capacity = capacity
+        self._free = [Fireball(0) for _ in range(capacity)]
+        # Постоянный номер шара в пуле - по нему шар узнают в сетевых снимках
+        for slot, fireball in enumerate(self._free):
+            fireball.slot = slot
+        self.allocated = capacity
+        self.dropped = 0
+        self.floor = HEIGHT
+        self._listed = None
+
+    def spawn(self, x):
+        if not self._free:
+            self.dropped += 1
+            return None
+        fireball = self._free.pop()
+        fireball.reset(x)
+        self.add(fireball)
+        return fireball
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._listed = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._free.append(sprite)
+        self._listed = None
+
+    def listed(self):
+        """(спрайты, их rect) в порядке группы - для collidelistall без цикла Python.
+
+        Rect общие со спрайтами, поэтому список остаётся верным, пока состав
+        группы не меняется; при добавлении или удалении он пересобирается.
+        """
+        if self._listed is None:
+            sprites = list(self.spritedict)
+            self._listed = (sprites, [s.rect for s in sprites])
+        return self._listed
+
+    def update(self):
+        """Fireball.update для всех шаров одним циклом по прямоугольникам."""
+        gone = []
+        floor = self.floor
+        for fireball in self.spritedict:
+            rect = fireball.rect
+            rect.y += fireball.speed
+            if rect.top > floor:
+                gone.append(fireball)
+        if gone:
+            self.remove(*gone)
+
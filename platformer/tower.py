@@ -0,0 +1,271 @@
+"""Башня: один уровень выше экрана - тысячи платформ и камера, которая едет вверх.
+
+Мир режется по высоте на куски CHUNK_HEIGHT. Кусок k - платформы, у
+которых верх лежит в (chunk_top(k), chunk_top(k) + CHUNK_HEIGHT]; y растёт
+вниз, поэтому чем выше кусок, тем меньше (отрицательнее) его координаты.
+В памяти живут только куски рядом с камерой (CHUNKS_BEHIND ниже и
+CHUNKS_AHEAD выше): их спрайты, сетки столкновений и сведённая картинка
+платформ. Остальные выбрасываются и при возвращении строятся заново.
+
+Кусок строится из своего зерна level_seed(seed, k) и последней платформы
+куска под ним, поэтому от одного куска на всю башню хранится только эта
+платформа (anchors) и номера собранных монеток. Цепочка платформ та же,
+что у generate_random_level: can_reach между соседями и достижимая монетка
+над каждой, но без ограничения высотой экрана.
+"""
+import random
+
+import pygame
+
+from .generation import can_reach, coin_is_reachable
+from .levels import level_seed
+from .settings import (WIDTH, HEIGHT, FPS, MAX_JUMP_HEIGHT, MAX_HORIZONTAL_DISTANCE,
+                       MIN_VERTICAL_PLATFORM_GAP, CHUNK_HEIGHT,
+                       CHUNKS_BEHIND, CHUNKS_AHEAD, CAMERA_FOLLOW, TOWER_PLATFORMS,
+                       TOWER_FIREBALL_INTERVAL)
+from .spatial import SpriteGrid
+from .sprites import Platform, Coin
+from .world import World, VICTORY, EVENT_VICTORY
+
+# Платформы и монетки выступают за границы своего куска (земля - на 40 пикселей
+# вниз, монетка - на 40 вверх): на столько куску расширяется поиск и картинка
+CHUNK_MARGIN = 64
+MAX_PLACEMENT_ATTEMPTS = 1000
+
+
+def chunk_of(y):
+    """Номер куска, которому принадлежит верх платформы y."""
+    return (HEIGHT - y) // CHUNK_HEIGHT
+
+
+def chunk_top(k):
+    return HEIGHT - (k + 1) * CHUNK_HEIGHT
+
+
+def generate_chunk(k, entry, placed, total, seed):
+    """Платформы и монетки куска k.
+
+    entry - (x, y, w, h) последней платформы куска k-1 (для k = 0 - None,
+    кусок начинается с земли), placed - сколько платформ построено до
+    этого куска. Возвращает (платформы, монетки, placed после куска).
+    """
+    rng = random.Random(level_seed(seed, k))
+    platforms = []
+    coins = []
+    if entry is None:
+        last = Platform(0, HEIGHT - 40, WIDTH, 40)
+        platforms.append(last)
+    else:
+        last = Platform(*entry)
+    bottom = chunk_top(k) + CHUNK_HEIGHT
+    while placed < total:
+        for _ in range(MAX_PLACEMENT_ATTEMPTS):
+            w = rng.randint(80, 150)
+            h = 20
+            # Первая платформа куска обязана попасть в него, а не остаться ниже
+            y = rng.randint(last.rect.top - MAX_JUMP_HEIGHT,
+                            min(last.rect.top - MIN_VERTICAL_PLATFORM_GAP, bottom))
+            x = rng.randint(
+                max(0, last.rect.centerx - MAX_HORIZONTAL_DISTANCE),
+                min(WIDTH - w, last.rect.centerx + MAX_HORIZONTAL_DISTANCE))
+            platform = Platform(x, y, w, h)
+            if can_reach(last, platform):
+                coin = Coin(x + w // 2, y - 30)
+                if coin_is_reachable(platform, coin):
+                    break
+        else:
+            raise RuntimeError(f"Кусок {k}: не удалось поставить платформу {placed + 1}")
+        if chunk_of(y) != k:
+            # Платформа уже выше куска - её построит следующий кусок из своего зерна
+            break
+        platforms.append(platform)
+        coins.append(coin)
+        last = platform
+        placed += 1
+    return platforms, coins, placed
+
+
+class Chunk:
+    """Кусок башни в памяти: спрайты, сетки для столкновений и картинка платформ."""
+
+    def __init__(self, k, platforms, coins):
+        self.k = k
+        self.platforms = platforms
+        self.coins = coins
+        self.top = chunk_top(k) - CHUNK_MARGIN
+        self.bottom = chunk_top(k) + CHUNK_HEIGHT + CHUNK_MARGIN
+        self.platform_index = SpriteGrid(platforms)
+        self.coin_index = SpriteGrid(coins)
+        self._layer = None
+
+    def layer(self):
+        """Платформы куска одной прозрачной поверхностью; рисовать в (0, self.top)."""
+        if self._layer is None:
+            layer = pygame.Surface((WIDTH, self.bottom - self.top), pygame.SRCALPHA)
+            for p in self.platforms:
+                layer.blit(p.image, (p.rect.x, p.rect.y - self.top))
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert_alpha()
+            self._layer = layer
+        return self._layer
+
+
+class ChunkedIndex:
+    """query(rect), как у SpriteGrid, по всем кускам в памяти снизу вверх."""
+
+    def __init__(self, world, attr):
+        self.world = world
+        self.attr = attr
+
+    def query(self, rect):
+        found = []
+        for chunk in self.world.resident:
+            if rect.bottom > chunk.top and rect.top < chunk.bottom:
+                found += getattr(chunk, self.attr).query(rect)
+        return found
+
+
+class Camera:
+    """Вертикальный сдвиг вида: y - мировая координата верхнего края экрана."""
+
+    def __init__(self):
+        self.y = 0.0
+        self.prev_y = 0.0
+
+    @property
+    def top(self):
+        return round(self.y)
+
+    @property
+    def bottom(self):
+        return self.top + HEIGHT
+
+    def follow(self, rect):
+        """Шаг камеры к игроку; ниже земли (y > 0) не опускается."""
+        self.prev_y = self.y
+        target = min(0.0, rect.centery - HEIGHT / 2)
+        self.y += (target - self.y) * CAMERA_FOLLOW
+
+
+class TowerWorld(World):
+    """Мир-башня: те же шаги и столкновения, что у World, но куски вместо уровней.
+
+    Победа - встать на самую верхнюю платформу. Монетки дают очки, собранные
+    запоминаются и не появляются снова, когда кусок строится повторно.
+    """
+
+    def __init__(self, num_platforms=TOWER_PLATFORMS, seed=None, dt_ms=1000 / FPS,
+                 fireball_interval=TOWER_FIREBALL_INTERVAL):
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.num_platforms = num_platforms
+        self.camera = Camera()
+
+        # На каждый построенный кусок: (последняя платформа, платформ всего);
+        # собранные монетки - битовая маска по номеру монетки в куске
+        self.anchors = []
+        self.collected = {}
+        self.chunks = {}
+        self.resident = []
+        self.goal = None
+        self.generated = 0
+        self.evicted = 0
+        # Остальное состояние партии - как у World; уровень один, его
+        # платформы и монетки приходят кусками из stream()
+        tower = {"platforms": [], "coins": [], "fireball_interval": fireball_interval}
+        super().__init__(levels=[tower], seed=seed, dt_ms=dt_ms)
+
+    def load_level(self, i):
+        self.level = self.levels[i]
+        self.platform_index = ChunkedIndex(self, "platform_index")
+        self.coin_index = ChunkedIndex(self, "coin_index")
+        self.stream()
+
+    @property
+    def height(self):
+        """Высота игрока над землёй в пикселях."""
+        return HEIGHT - 40 - self.player.rect.bottom
+
+    def _exists(self, k):
+        """Есть ли в башне кусок k; достраивает цепочку кусков под ним."""
+        if k <= 0:
+            return k == 0
+        while len(self.anchors) < k:
+            if self.anchors and self.anchors[-1][1] >= self.num_platforms:
+                return False
+            self._build(len(self.anchors))
+        return self.anchors[k - 1][1] < self.num_platforms
+
+    def _build(self, k):
+        entry, placed = self.anchors[k - 1] if k else (None, 0)
+        platforms, coins, placed = generate_chunk(k, entry, placed, self.num_platforms, self.seed)
+        self.generated += 1
+        if len(self.anchors) == k:
+            self.anchors.append((tuple(platforms[-1].rect), placed))
+            if placed == self.num_platforms:
+                self.goal = pygame.Rect(platforms[-1].rect)
+        return Chunk(k, platforms, coins)
+
+    def stream(self):
+        """Держит в памяти куски вокруг камеры и игрока, остальные выбрасывает."""
+        rect = self.player.rect
+        lo = max(0, min(chunk_of(self.camera.bottom), chunk_of(rect.bottom)) - CHUNKS_BEHIND)
+        hi = max(chunk_of(self.camera.top), chunk_of(rect.top)) + CHUNKS_AHEAD
+        changed = False
+        for k in [k for k in self.chunks if not lo <= k <= hi]:
+            chunk = self.chunks.pop(k)
+            self.platform_group.remove(chunk.platforms)
+            self.coin_group.remove(chunk.coins)
+            self.evicted += 1
+            changed = True
+        for k in range(lo, hi + 1):
+            if k not in self.chunks and self._exists(k):
+                chunk = self._build(k)
+                self.platform_group.add(chunk.platforms)
+                taken = self.collected.get(k, 0)
+                self.coin_group.add([c for i, c in enumerate(chunk.coins) if not taken >> i & 1])
+                self.chunks[k] = chunk
+                changed = True
+        if changed:
+            self.resident = [self.chunks[k] for k in sorted(self.chunks)]
+
+    def _remember_collected(self):
+        for chunk in self.resident:
+            for i, coin in enumerate(chunk.coins):
+                if not coin.alive():
+                    self.collected[chunk.k] = self.collected.get(chunk.k, 0) | 1 << i
+
+    # Шаг башни - World.step; отличия только в хуках
+    def _before_physics(self):
+        # Куски подгружаются до физики: после попадания игрок мог перенестись
+        self.stream()
+
+    def _after_player(self):
+        self.camera.follow(self.player.rect)
+        self.fireball_group.floor = self.camera.bottom
+
+    def _collect_coins(self):
+        score = self.score
+        super()._collect_coins()
+        if self.score != score:
+            self._remember_collected()
+
+    def _spawn_fireball(self):
+        # Шары падают с верхнего края камеры, а не с y = 0
+        fireball = super()._spawn_fireball()
+        if fireball is not None:
+            fireball.rect.bottom = self.camera.top
+        return fireball
+
+    def _check_progress(self):
+        """Победа - стоять на самой верхней платформе; уровней у башни нет."""
+        player = self.player
+        if not player.on_ground:
+            return
+        self.spawn_point = player.rect.topleft
+        goal = self.goal
+        if (goal is not None and player.rect.bottom == goal.top
+                and player.rect.right > goal.left and player.rect.left < goal.right):
+            self.state = VICTORY
+            self.events.append(EVENT_VICTORY)
@@ -0,0 +1,218 @@
+"""Мир одной партии без окна: шаги физики, столкновения и смена уровней.
+
+Модуль не открывает окно и не играет звуки, поэтому его можно импортировать
+в тестах и пакетных прогонах. Мир шагает с фиксированным шагом времени,
+а отрисовка и звук читают его состояние снаружи (см. game.py и render.py).
+"""
+import random
+
+import pygame
+
+from .generation import generate_random_level
+from .levels import LevelProvider
+from .spatial import SpriteGrid
+from .sprites import Player, FireballPool
+from .settings import WIDTH, FPS, NUM_LEVELS, START_LIVES, PLAYER_START
+
+# События шага мира, по ним внешний слой играет звуки и показывает заставки
+EVENT_JUMP = "jump"
+EVENT_COIN = "coin"
+EVENT_HURT = "hurt"
+EVENT_LEVEL = "level"
+EVENT_GAME_OVER = "game_over"
+EVENT_VICTORY = "victory"
+
+# Состояния мира
+PLAYING = "playing"
+GAME_OVER = "game_over"
+VICTORY = "victory"
+
+
+class World:
+    """Состояние одной партии без окна и часов.
+
+    Каждый вызов step() продвигает игру ровно на dt_ms миллисекунд:
+    физика игрока, огненные шары, сбор монеток и переход на следующий уровень.
+    События шага (прыжок, монетка, попадание, смена уровня, конец игры)
+    складываются в self.events - по ним внешний слой играет звуки и заставки.
+    """
+
+    def __init__(self, levels=None, seed=None, dt_ms=1000 / FPS):
+        if levels is None:
+            levels = LevelProvider(generate_random_level, NUM_LEVELS, seed=seed)
+        self.levels = levels
+        self.rng = random.Random(seed)
+        self.dt_ms = dt_ms
+        self.time_ms = 0
+        self.current_level = 0
+        self.score = 0
+        self.lives = START_LIVES
+        self.state = PLAYING
+        self.events = []
+        # FrameProfiler или None: step() отмечает в нём свои фазы
+        self.profiler = None
+        # Сколько тестов масок сделано и сэкономлено за последний шаг
+        self.narrow_tests = 0
+        self.narrow_skipped = 0
+
+        self.player = Player(*PLAYER_START)
+        # Куда возвращается игрок после попадания огненного шара
+        self.spawn_point = PLAYER_START
+        self.player_group = pygame.sprite.Group(self.player)
+        self.platform_group = pygame.sprite.Group()
+        self.coin_group = pygame.sprite.Group()
+        self.fireball_group = FireballPool()
+        self.last_fireball_time = 0
+
+        self.load_level(self.current_level)
+
+    @property
+    def done(self):
+        return self.state != PLAYING
+
+    def load_level(self, i):
+        self.level = self.levels[i]
+        self.platform_group.empty()
+        self.coin_group.empty()
+        self.fireball_group.empty()
+        for p in self.level["platforms"]:
+            self.platform_group.add(p)
+        for c in self.level["coins"]:
+            self.coin_group.add(c)
+        self.platform_index = SpriteGrid(self.platform_group)
+        self.coin_index = SpriteGrid(self.coin_group)
+        # Следующий уровень готовим в фоне, пока идёт этот
+        prefetch = getattr(self.levels, "prefetch", None)
+        if prefetch is not None:
+            prefetch(i + 1)
+
+    def step(self, direction=0, jump=False):
+        """Один фиксированный шаг игры. Возвращает список событий шага.
+
+        Порядок фаз общий для всех миров; TowerWorld меняет только хуки
+        _before_physics, _after_player, _spawn_fireball и _check_progress.
+        """
+        self.events = []
+        if self.done:
+            return self.events
+        self.time_ms += self.dt_ms
+        player = self.player
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.lap()
+
+        self._before_physics()
+
+        if jump and player.jump():
+            self.events.append(EVENT_JUMP)
+
+        player.update(direction, self.time_ms, self.platform_index)
+        if profiler is not None:
+            profiler.mark("player")
+        self._after_player()
+        self.fireball_group.update()
+        self.platform_group.update()
+        if profiler is not None:
+            profiler.mark("fireballs")
+
+        self.narrow_tests = 0
+        self.narrow_skipped = 0
+        self._collect_coins()
+        if profiler is not None:
+            profiler.mark("coins")
+
+        if self.time_ms - self.last_fireball_time > self.level["fireball_interval"]:
+            self._spawn_fireball()
+            self.last_fireball_time = self.time_ms
+
+        self._check_fireballs()
+        if profiler is not None:
+            profiler.mark("hits")
+
+        if self.state == PLAYING:
+            self._check_progress()
+
+        return self.events
+
+    def _before_physics(self):
+        """Перед физикой шага; у World ничего не делает."""
+
+    def _after_player(self):
+        """После движения игрока, до огненных шаров; у World ничего не делает."""
+
+    def _spawn_fireball(self):
+        """Новый огненный шар (или None, если пул пуст)."""
+        return self.fireball_group.spawn(self.rng.randint(0, WIDTH - 30))
+
+    def _check_progress(self):
+        """Конец шага: собраны все монетки - следующий уровень или победа."""
+        if self.coin_group:
+            return
+        if self.current_level < len(self.levels) - 1:
+            self.current_level += 1
+            self.load_level(self.current_level)
+            self.player.rect.topleft = PLAYER_START
+            self.player.vel_y = 0
+            self.events.append(EVENT_LEVEL)
+        else:
+            self.state = VICTORY
+            self.events.append(EVENT_VICTORY)
+
+    # Столкновения: сначала дешёвый отсев по прямоугольникам (сетка монеток,
+    # collidelistall для шаров), маски сравниваются только у оставшихся.
+    # narrow_tests / narrow_skipped - сколько тестов масок сделано и сэкономлено за шаг.
+    # take_coins и fireball_hits работают с любым спрайтом игрока - их же
+    # вызывает MultiWorld (server.py) для каждого из своих игроков.
+    def take_coins(self, player):
+        """Убирает монетки, которых касается player; возвращает, сколько собрано."""
+        coins = self.coin_group
+        candidates = [c for c in self.coin_index.query(player.rect)
+                      if c in coins and player.rect.colliderect(c.rect)]
+        self.narrow_tests += len(candidates)
+        self.narrow_skipped += len(coins) - len(candidates)
+        taken = 0
+        for coin in candidates:
+            if pygame.sprite.collide_mask(player, coin):
+                coin.kill()
+                taken += 1
+        return taken
+
+    def fireball_hits(self, player, on_hit):
+        """Вызывает on_hit() на каждое попадание шара в player.
+
+        on_hit переносит игрока; остальные шары проверяются уже у новой
+        позиции, так что шар на точке возрождения попадает второй раз.
+        """
+        fireballs, rects = self.fireball_group.listed()
+        candidates = player.rect.collidelistall(rects)
+        tested = 0
+        k = 0
+        while k < len(candidates):
+            i = candidates[k]
+            k += 1
+            tested += 1
+            if pygame.sprite.collide_mask(player, fireballs[i]):
+                on_hit()
+                candidates = [j for j in player.rect.collidelistall(rects) if j > i]
+                k = 0
+        self.narrow_tests += tested
+        self.narrow_skipped += len(rects) - tested
+
+    def _collect_coins(self):
+        taken = self.take_coins(self.player)
+        self.score += 10 * taken
+        self.events += [EVENT_COIN] * taken
+
+    def _check_fireballs(self):
+        self.fireball_hits(self.player, self._hit)
+
+    def _hit(self):
+        player = self.player
+        self.lives -= 1
+        if player.take_hit(self.time_ms):
+            self.events.append(EVENT_HURT)
+        player.rect.topleft = self.spawn_point
+        if self.lives <= 0 and self.state == PLAYING:
+            self.state = GAME_OVER
+            self.events.append(EVENT_GAME_OVER)
+
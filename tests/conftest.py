@@ -0,0 +1,9 @@
+"""Общее для тестов: пакет из корня репозитория и pygame без окна и звука."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Без дискового кэша картинок: тесты не читают и не пишут кэш в домашнем каталоге
+os.environ["PLATFORMER_ASSET_CACHE"] = ""
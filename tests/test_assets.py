@@ -0,0 +1,29 @@
+"""Дисковый кэш картинок: испорченная запись - промах, битый исходник - заглушка."""
+import os
+
+import pygame
+
+from platformer import assets
+
+PATH, SIZE = assets.IMAGES["coin"]
+
+
+def test_corrupt_cache_entry_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "ASSET_CACHE_DIR", str(tmp_path))
+    first = assets._decode_image(PATH, SIZE)
+    (entry,) = os.listdir(tmp_path)
+    with open(tmp_path / entry, "wb") as f:
+        f.write(b"\x00" * 10)
+    again = assets._decode_image(PATH, SIZE)
+    assert pygame.image.tobytes(again, "RGBA") == pygame.image.tobytes(first, "RGBA")
+    assert os.path.getsize(tmp_path / entry) == SIZE[0] * SIZE[1] * 4
+
+
+def test_bad_source_gives_blank_surface(tmp_path, monkeypatch):
+    bad = tmp_path / "bad.png"
+    bad.write_bytes(b"not a png")
+    monkeypatch.setattr(assets, "resource_path", lambda path: str(bad))
+    for cache in ("", str(tmp_path / "cache")):
+        monkeypatch.setattr(assets, "ASSET_CACHE_DIR", cache)
+        image = assets._decode_image(PATH, SIZE)
+        assert image.get_size() == SIZE
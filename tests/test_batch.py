@@ -0,0 +1,43 @@
+"""BatchPhysics.step шаг в шаг совпадает с Player.update."""
+import random
+
+import numpy as np
+
+from platformer.batch import BatchPhysics
+from platformer.settings import WIDTH, HEIGHT, PLAYER_START
+from platformer.spatial import SpriteGrid
+from platformer.sprites import Player, Platform
+
+LAYOUTS = 50
+STEPS = 3000
+
+
+def random_layout(rng):
+    """Земля и платформы вперемешку; часть лежит внахлёст - проверка "первая по порядку"."""
+    layout = [Platform(0, HEIGHT - 40, WIDTH, 40)]
+    for _ in range(rng.randint(3, 15)):
+        w = rng.randint(40, 300)
+        layout.append(Platform(rng.randint(0, WIDTH - w), rng.randint(100, HEIGHT - 60), w, rng.randint(5, 30)))
+    return layout
+
+
+def test_batch_matches_player_update():
+    rng = random.Random(2)
+    layouts = [random_layout(rng) for _ in range(LAYOUTS)]
+    players = [Player(*PLAYER_START) for _ in layouts]
+    indexes = [SpriteGrid(layout) for layout in layouts]
+    batch = BatchPhysics(layouts, start=PLAYER_START)
+
+    for step in range(STEPS):
+        direction = np.array([rng.choice((-1, 0, 1)) for _ in layouts])
+        jump = np.array([rng.random() < 0.1 for _ in layouts])
+        for i, player in enumerate(players):
+            if jump[i]:
+                player.jump()
+            player.update(int(direction[i]), 0, indexes[i])
+        batch.step(direction, jump)
+
+        assert list(batch.x) == [p.rect.x for p in players], f"x, шаг {step}"
+        assert list(batch.y) == [p.rect.y for p in players], f"y, шаг {step}"
+        assert list(batch.vel_y) == [p.vel_y for p in players], f"vel_y, шаг {step}"
+        assert list(batch.on_ground) == [p.on_ground for p in players], f"on_ground, шаг {step}"
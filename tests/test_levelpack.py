@@ -0,0 +1,19 @@
+"""Набор уровней: запись и чтение дают те же записи и зёрна."""
+import random
+
+from platformer.generation import generate_random_level
+from platformer.levelpack import LevelPack, generate_pack, level_records
+from platformer.levels import level_seed
+
+
+def test_round_trip_negative_seed(tmp_path):
+    path = tmp_path / "levels.lvpk"
+    generate_pack(path, 4, seed=-7)
+    with LevelPack(path) as pack:
+        assert len(pack) == 4
+        for i in range(4):
+            assert pack.seed(i) == level_seed(-7, i)
+            expected = level_records(generate_random_level(i, random.Random(level_seed(-7, i))))
+            platforms, coins, interval = pack.records(i)
+            assert (platforms, [tuple(c) for c in coins], interval) == \
+                (expected[0], [tuple(c) for c in expected[1]], expected[2])
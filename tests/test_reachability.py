@@ -0,0 +1,63 @@
+"""JumpSolver.reaches совпадает с пошаговой simulate_jump на случайном наборе прыжков."""
+import random
+
+from platformer import sprites
+from platformer.sprites import load_images
+
+CASES = 20000
+
+
+def solver():
+    load_images()
+    return sprites.COIN_JUMP
+
+
+def random_case(rng, vx):
+    start = (rng.randint(0, 800), rng.randint(100, 600))
+    target = (start[0] + rng.randint(-320, 320), start[1] + rng.randint(-160, 60))
+    return start, target, vx
+
+
+def check(cases):
+    jump = solver()
+    mismatches = [case for case in cases if jump.reaches(*case) != jump.simulate(*case)]
+    assert not mismatches, f"{len(mismatches)} расхождений, например {mismatches[:5]}"
+
+
+def test_random_vx():
+    rng = random.Random(5)
+    # Двоичные дроби (точная арифметика) и произвольные вещественные скорости
+    check([random_case(rng, rng.choice((rng.randint(-8, 8) / 4, rng.uniform(-6, 6))))
+           for _ in range(CASES)])
+
+
+def test_vertical_jump():
+    rng = random.Random(6)
+    jump = solver()
+    cases = [random_case(rng, 0) for _ in range(CASES)]
+    # dx == 0: цель прямо над точкой старта, как у монетки над центром платформы
+    cases += [((x, y), (x - rng.randint(0, jump.pw), y - rng.randint(0, 160)), 0)
+              for x, y in ((rng.randint(0, 800), rng.randint(100, 600)) for _ in range(CASES))]
+    check(cases)
+
+
+def test_near_integer_fallback():
+    """Скорости вида n/3, n/10: x_k попадает почти в целое, и reaches() обязан уйти в симуляцию."""
+    rng = random.Random(7)
+    jump = solver()
+    fallbacks = []
+    simulate = jump.simulate
+
+    def counting(*args):
+        fallbacks.append(args)
+        return simulate(*args)
+
+    jump.simulate = counting
+    try:
+        cases = [random_case(rng, rng.randint(-18, 18) / rng.choice((3, 10)))
+                 for _ in range(CASES)]
+        mismatches = [case for case in cases if jump.reaches(*case) != simulate(*case)]
+    finally:
+        del jump.simulate
+    assert fallbacks, "ни один случай не дошёл до запасной симуляции"
+    assert not mismatches, f"{len(mismatches)} расхождений, например {mismatches[:5]}"
@@ -0,0 +1,65 @@
+"""MultiWorld с одним игроком шагает так же, как World; сервер переживает испорченные сообщения."""
+import asyncio
+import random
+
+from platformer import net
+from platformer.replay import input_bits, input_direction
+from platformer.server import GameServer, MultiWorld
+from platformer.world import World, EVENT_HURT
+
+GAMES = 20
+STEPS = 3000
+
+
+def test_single_player_matches_world():
+    hits = 0
+    for game in range(GAMES):
+        world = World(seed=game)
+        multi = MultiWorld(seed=game)
+        ident = multi.join()
+        player = multi.players[ident]
+        rng = random.Random(game)
+        for step in range(STEPS):
+            left, right, jump = rng.random() < 0.3, rng.random() < 0.4, rng.random() < 0.1
+            bits = input_bits(left, right, jump)
+            events = world.step(input_direction(bits), jump)
+            multi.set_input(ident, bits)
+            multi_events = [event for _, event in multi.step()]
+            if world.done:
+                # Конец партии у MultiWorld - новый раунд, дальше правила расходятся
+                break
+            assert events == multi_events, f"партия {game}, шаг {step}"
+            assert (world.score, world.lives, world.player.rect.topleft, world.player.vel_y) == \
+                (player.score, player.lives, player.sprite.rect.topleft, player.sprite.vel_y)
+            hits += events.count(EVENT_HURT)
+    assert hits, "ни одного попадания - тест ничего не проверил"
+
+
+def test_malformed_frame_drops_only_that_client(capsys):
+    async def scenario():
+        server = GameServer(MultiWorld(seed=1), port=0)
+        await server.start()
+        run = asyncio.create_task(server.run())
+        good_reader, good_writer = await asyncio.open_connection(server.host, server.port)
+        good_writer.write(net.frame(net.MSG_HELLO))
+        assert (await net.read_frame(good_reader))[0] == net.MSG_WELCOME
+        for bad in (net.frame(net.MSG_INPUT, b"\0\0"), net.FRAME.pack(0)):
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(net.frame(net.MSG_HELLO))
+            await net.read_frame(reader)
+            writer.write(bad)
+            # Сервер закрывает соединение: дочитываем до конца потока
+            while await reader.read(65536):
+                pass
+            writer.close()
+        assert list(server.clients) == [1]
+        # Исправный клиент по-прежнему получает снимки
+        kinds = {(await net.read_frame(good_reader))[0] for _ in range(5)}
+        assert net.MSG_SNAPSHOT in kinds
+        good_writer.close()
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        await server.close()
+    asyncio.run(scenario())
+    # Оба соединения закрыты обработчиком с записью в лог, а не упавшей задачей
+    assert capsys.readouterr().out.count("неверное сообщение") == 2
@@ -0,0 +1,65 @@
+"""Башня: цепочка платформ проходима, в памяти мало кусков, собранные монетки не возвращаются."""
+from platformer.generation import can_reach, coin_is_reachable
+from platformer.settings import CHUNKS_BEHIND, CHUNKS_AHEAD
+from platformer.tower import TowerWorld, generate_chunk
+from platformer.world import VICTORY
+
+PLATFORMS = 300
+SEED = 1
+STEPS_PER_PLATFORM = 10
+
+
+def tower_chain():
+    """Все платформы и монетки башни по кускам, как их строит TowerWorld."""
+    platforms, coins = [], []
+    entry, placed, k = None, 0, 0
+    while placed < PLATFORMS:
+        chunk_platforms, chunk_coins, placed = generate_chunk(k, entry, placed, PLATFORMS, SEED)
+        platforms += chunk_platforms
+        coins += chunk_coins
+        entry = tuple(chunk_platforms[-1].rect)
+        k += 1
+    return platforms, coins, k
+
+
+def test_chain_is_reachable():
+    platforms, coins, _ = tower_chain()
+    assert len(platforms) == PLATFORMS + 1  # и земля
+    for prev, platform, coin in zip(platforms, platforms[1:], coins):
+        assert can_reach(prev, platform), tuple(platform.rect)
+        assert coin_is_reachable(platform, coin), coin.rect.center
+
+
+def stand_on(world, platform):
+    world.player.rect.midbottom = platform.rect.midtop
+    world.player.vel_y = 0
+    for _ in range(STEPS_PER_PLATFORM):
+        world.step()
+
+
+def test_climb_keeps_few_chunks_and_remembers_coins():
+    platforms, _, total_chunks = tower_chain()
+    world = TowerWorld(PLATFORMS, seed=SEED)
+    world.lives = 10 ** 6  # огненные шары не должны закончить подъём
+    bound = CHUNKS_BEHIND + CHUNKS_AHEAD + 3
+    assert total_chunks > bound
+
+    most = 0
+    for platform in platforms[:-1]:
+        stand_on(world, platform)
+        most = max(most, len(world.chunks))
+    assert most <= bound
+    assert world.evicted > 0
+    assert world.collected.get(0), "на нижнем куске не собрано ни одной монетки"
+
+    # Спуск обратно: нижний кусок строится заново без собранных монеток
+    generated = world.generated
+    stand_on(world, platforms[0])
+    assert world.generated > generated
+    for chunk in world.resident:
+        taken = world.collected.get(chunk.k, 0)
+        for i, coin in enumerate(chunk.coins):
+            assert coin.alive() != bool(taken >> i & 1), (chunk.k, i)
+
+    stand_on(world, platforms[-1])
+    assert world.state == VICTORY
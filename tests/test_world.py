@@ -0,0 +1,94 @@
+"""Столкновения World после отсева по прямоугольникам дают то же, что перебор всех спрайтов."""
+import random
+
+import pygame
+
+from platformer.generation import generate_random_level
+from platformer.settings import WIDTH, HEIGHT, NUM_LEVELS
+from platformer.sprites import Platform, Coin
+from platformer.world import World, PLAYING, GAME_OVER, EVENT_COIN, EVENT_HURT, EVENT_GAME_OVER
+
+GAMES = 30
+STEPS = 1500
+SCENES = 500
+
+
+class BruteWorld(World):
+    """Эталон: spritecollide по всем монеткам и проверка масок у каждого шара."""
+
+    def _collect_coins(self):
+        for _ in pygame.sprite.spritecollide(self.player, self.coin_group, True, pygame.sprite.collide_mask):
+            self.score += 10
+            self.events.append(EVENT_COIN)
+
+    def _check_fireballs(self):
+        player = self.player
+        for fireball in list(self.fireball_group):
+            if pygame.sprite.collide_mask(player, fireball):
+                self.lives -= 1
+                if player.take_hit(self.time_ms):
+                    self.events.append(EVENT_HURT)
+                player.rect.topleft = self.spawn_point
+                if self.lives <= 0 and self.state == PLAYING:
+                    self.state = GAME_OVER
+                    self.events.append(EVENT_GAME_OVER)
+
+
+def levels(seed):
+    # Частые огненные шары - попаданий за партию много
+    result = [generate_random_level(i, random.Random(seed * 100 + i)) for i in range(NUM_LEVELS)]
+    for level in result:
+        level["fireball_interval"] = 150
+    return result
+
+
+def test_collisions_match_brute_force():
+    hits = 0
+    for game in range(GAMES):
+        world = World(levels=levels(game), seed=game)
+        reference = BruteWorld(levels=levels(game), seed=game)
+        assert world.narrow_tests == world.narrow_skipped == 0
+        rng = random.Random(game)
+        for step in range(STEPS):
+            direction = rng.choice((-1, 0, 1))
+            jump = rng.random() < 0.1
+            events = world.step(direction, jump)
+            assert events == reference.step(direction, jump), f"партия {game}, шаг {step}"
+            assert (world.score, world.lives, world.state, world.player.rect.topleft) == \
+                (reference.score, reference.lives, reference.state, reference.player.rect.topleft)
+            hits += events.count(EVENT_HURT)
+            if world.done:
+                break
+    assert hits, "ни одного попадания - тест ничего не проверил"
+
+
+def scene(seed, world_class):
+    """Мир с густо разбросанными монетками и шарами; часть шаров - на точке возрождения."""
+    rng = random.Random(seed)
+    coins = [Coin(rng.randint(10, WIDTH - 10), rng.randint(10, HEIGHT - 60)) for _ in range(rng.randint(20, 200))]
+    level = {"platforms": [Platform(0, HEIGHT - 40, WIDTH, 40)], "coins": coins, "fireball_interval": 10 ** 9}
+    world = world_class(levels=[level], seed=0)
+    world.spawn_point = (rng.randint(0, WIDTH - 60), rng.randint(0, HEIGHT - 100))
+    for _ in range(rng.randint(0, 40)):
+        fireball = world.fireball_group.spawn(rng.randint(0, WIDTH - 30))
+        fireball.rect.y = rng.randint(0, HEIGHT - 30)
+        if rng.random() < 0.2:
+            fireball.rect.topleft = (world.spawn_point[0] + rng.randint(-20, 50),
+                                     world.spawn_point[1] + rng.randint(-20, 50))
+    world.player.rect.topleft = (rng.randint(0, WIDTH - 60), rng.randint(0, HEIGHT - 60))
+    return world
+
+
+def test_dense_scenes_match_brute_force():
+    """Несколько монеток за раз и шар на точке возрождения - второе попадание в том же шаге."""
+    double_hits = 0
+    for seed in range(SCENES):
+        results = []
+        for world in (scene(seed, World), scene(seed, BruteWorld)):
+            world.events = []
+            world._collect_coins()
+            world._check_fireballs()
+            results.append((world.events, world.score, world.lives, world.player.rect.topleft, len(world.coin_group)))
+        assert results[0] == results[1], f"сцена {seed}"
+        double_hits += results[0][2] <= 1
+    assert double_hits, "ни одного повторного попадания - тест ничего не проверил"